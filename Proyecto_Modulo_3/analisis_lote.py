@@ -0,0 +1,218 @@
+import argparse
+import glob
+import json
+import os
+import time
+from collections import defaultdict
+from multiprocessing import Pool
+
+import cv2
+import numpy as np
+
+from deteccion import CLASSES
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv")
+# Cuadros por tarea al repartir un video largo entre procesos
+VIDEO_CHUNK_FRAMES = 600
+
+# Un pipeline por proceso: la red Caffe se carga una sola vez por worker
+_pipeline = None
+
+
+def _init_worker(face_backend):
+    global _pipeline
+    from procesamiento import DetectionPipeline
+    cv2.setNumThreads(1)
+    _pipeline = DetectionPipeline(face_backend=face_backend, verbose=False)
+
+
+def collect_inputs(paths):
+    """Expande carpetas en una lista ordenada de (archivo, nombre de salida).
+
+    El nombre de salida conserva la ruta relativa a la carpeta de entrada
+    (perros/a.jpg y gatos/a.jpg no se pisan); si aun así se repite, se le
+    agrega un sufijo numérico.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for f in sorted(glob.glob(os.path.join(path, "**", "*"), recursive=True)):
+                files.append((f, os.path.relpath(f, path)))
+        else:
+            files.append((path, os.path.basename(path)))
+
+    inputs, used = [], set()
+    for f, rel in files:
+        if not f.lower().endswith(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS):
+            continue
+        stem, ext = os.path.splitext(rel)
+        name, n = rel, 1
+        while name in used:
+            n += 1
+            name = f"{stem}_{n}{ext}"
+        used.add(name)
+        inputs.append((f, name))
+    return inputs
+
+
+def _output_path(out_dir, name):
+    path = os.path.join(out_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def _record(source, frame_idx, face_locations, face_names, detecciones, timings):
+    return {
+        "source": source,
+        "frame": frame_idx,
+        "faces": [{"box": [int(l), int(t), int(r), int(b)], "name": name}
+                  for (t, r, b, l), name in zip(face_locations, face_names)],
+        "animals": [{"box": [int(d['startX']), int(d['startY']), int(d['endX']), int(d['endY'])],
+                     "label": CLASSES[d['class_id']],
+                     "confidence": round(float(d['confidence']), 4)}
+                    for d in detecciones],
+        "ms": {k: round(v, 2) for k, v in timings.items()},
+    }
+
+
+def _process_image(path, name, mode, out_dir):
+    image = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        return [{"source": path, "error": "no se pudo leer la imagen"}]
+
+    t0 = time.perf_counter()
+    image, _, faces, names, dets = _pipeline.process_frame_for_objects(image, mode)
+    timings = dict(_pipeline.timings, total=(time.perf_counter() - t0) * 1000)
+
+    if out_dir:
+        cv2.imwrite(_output_path(out_dir, name), image)
+    return [_record(path, 0, faces, names, dets, timings)]
+
+
+def _process_video(path, name, mode, out_dir, stride, start=0, end=None):
+    """Procesa los cuadros [start, end) del video (todo el video por defecto)."""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        return [{"source": path, "error": "no se pudo abrir el video"}]
+    if start:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+
+    writer = None
+    records = []
+    frame_idx = start
+    while end is None or frame_idx < end:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        if frame_idx % stride == 0:
+            t0 = time.perf_counter()
+            frame, _, faces, names, dets = _pipeline.process_frame_for_objects(frame, mode)
+            timings = dict(_pipeline.timings, total=(time.perf_counter() - t0) * 1000)
+            records.append(_record(path, frame_idx, faces, names, dets, timings))
+
+            if out_dir:
+                if writer is None:
+                    h, w = frame.shape[:2]
+                    fps = (cap.get(cv2.CAP_PROP_FPS) or 30.0) / stride
+                    out_name = os.path.splitext(name)[0] + "_anotado.mp4"
+                    writer = cv2.VideoWriter(_output_path(out_dir, out_name),
+                                             cv2.VideoWriter_fourcc(*"mp4v"), fps, (w, h))
+                writer.write(frame)
+        frame_idx += 1
+
+    cap.release()
+    if writer is not None:
+        writer.release()
+    return records
+
+
+def _process_file(task):
+    path, name, mode, out_dir, stride, start, end = task
+    if path.lower().endswith(VIDEO_EXTENSIONS):
+        return _process_video(path, name, mode, out_dir, stride, start, end)
+    return _process_image(path, name, mode, out_dir)
+
+
+def make_tasks(inputs, mode, out_dir, stride, chunk_frames=VIDEO_CHUNK_FRAMES):
+    """Una tarea por imagen; los videos largos se parten en rangos de cuadros.
+
+    Con --anotadas los videos no se parten: el video anotado se escribe en
+    orden desde un solo proceso.
+    """
+    tasks = []
+    for path, name in inputs:
+        n_frames = 0
+        if path.lower().endswith(VIDEO_EXTENSIONS) and not out_dir:
+            cap = cv2.VideoCapture(path)
+            n_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+            cap.release()
+        if n_frames <= chunk_frames:
+            tasks.append((path, name, mode, out_dir, stride, 0, None))
+            continue
+        # Los cortes caen en múltiplos de 'stride' para procesar los mismos cuadros
+        step = max(stride, chunk_frames // stride * stride)
+        for start in range(0, n_frames, step):
+            end = start + step if start + step < n_frames else None
+            tasks.append((path, name, mode, out_dir, stride, start, end))
+    return tasks
+
+
+def summarize(records, wall_time):
+    """Resumen de rendimiento: cuadros/s y ms promedio por etapa."""
+    frames = [r for r in records if "ms" in r]
+    etapas = defaultdict(list)
+    for r in frames:
+        for k, v in r["ms"].items():
+            etapas[k].append(v)
+
+    print("\n" + "=" * 50)
+    print(f" Cuadros procesados: {len(frames)}  (errores: {len(records) - len(frames)})")
+    print(f" Tiempo total: {wall_time:.2f} s")
+    print(f" Rendimiento: {len(frames) / wall_time if wall_time > 0 else 0:.2f} cuadros/s")
+    print("-" * 50)
+    for etapa, valores in sorted(etapas.items()):
+        print(f" {etapa:<22} media {np.mean(valores):8.2f} ms   p95 {np.percentile(valores, 95):8.2f} ms")
+    print("=" * 50)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Análisis por lotes de personas y animales.")
+    parser.add_argument("entradas", nargs="+", help="Imágenes, videos o carpetas")
+    parser.add_argument("--salida", default="detecciones.jsonl", help="Archivo JSONL de resultados")
+    parser.add_argument("--anotadas", default=None, help="Carpeta para imágenes/videos anotados")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--modo", choices=["static", "live"], default="static",
+                        help="'static' = multi-escala (como cargar imagen), 'live' = como la cámara")
+    parser.add_argument("--cada", type=int, default=1, help="En videos, procesar 1 de cada N cuadros")
+    parser.add_argument("--backend", default=None, help="Backend de rostros (por defecto el de la app)")
+    args = parser.parse_args()
+
+    inputs = collect_inputs(args.entradas)
+    if not inputs:
+        print("Error: no se encontraron imágenes ni videos.")
+        return
+    if args.anotadas:
+        os.makedirs(args.anotadas, exist_ok=True)
+
+    from procesamiento import FACE_DETECTOR_BACKEND
+    backend = args.backend or FACE_DETECTOR_BACKEND
+    tasks = make_tasks(inputs, args.modo, args.anotadas, max(1, args.cada))
+
+    print(f"Analizando {len(inputs)} archivo(s) en {len(tasks)} tarea(s) con {args.workers} proceso(s)...")
+    records = []
+    t0 = time.perf_counter()
+    with Pool(args.workers, initializer=_init_worker, initargs=(backend,)) as pool, \
+            open(args.salida, "w", encoding="utf-8") as out:
+        for file_records in pool.imap_unordered(_process_file, tasks):
+            for r in file_records:
+                out.write(json.dumps(r, ensure_ascii=False) + "\n")
+            records.extend(file_records)
+    wall_time = time.perf_counter() - t0
+
+    print(f"Resultados guardados en '{args.salida}'")
+    summarize(records, wall_time)
+
+
+if __name__ == "__main__":
+    main()
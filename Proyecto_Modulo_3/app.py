@@ -2,12 +2,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from PIL import Image, ImageTk
 import cv2
-import face_recognition
+import json
 import os
 import numpy as np
 import threading
 import time
 
+from deteccion import empty_detections
+from seguimiento import OpticalFlowTracker
+from movimiento import MotionGate
+from procesamiento import DetectionPipeline
+from perfilador import StageProfiler
+
 # --- CONFIGURACIÓN DE COLORES ---
 COLOR_BG_MAIN = "#F0F2F5"      
 COLOR_HEADER = "#2C3E50"   
@@ -26,6 +32,35 @@ FONT_LABEL = ("Segoe UI", 10)
 FONT_BTN = ("Segoe UI", 10, "bold")
 FONT_STATUS = ("Segoe UI", 10, "bold")
 
+# --- PRESENTACIÓN ---
+DISPLAY_WIDTH = 640
+DISPLAY_HEIGHT = 480
+# El hilo de Tk refresca el video con este intervalo (~30 FPS)
+DISPLAY_INTERVAL_MS = 33
+
+# --- DETECCIÓN + SEGUIMIENTO ---
+# Los detectores corren cada N cuadros; en medio las cajas se siguen con flujo óptico
+DETECT_EVERY_N_FRAMES = 5
+# Si una caja pierde demasiados puntos se fuerza una nueva detección
+MIN_TRACK_CONFIDENCE = 0.5
+
+# --- COMPUERTA DE MOVIMIENTO ---
+# Sin cambios en la escena se reutilizan las detecciones previas (ver movimiento.py)
+MOTION_GATE_ENABLED = True
+# Cada cuántos segundos imprimir las estadísticas de la compuerta
+GATE_STATS_INTERVAL = 10.0
+
+# --- PERFILADOR ---
+# F2 muestra/oculta la tabla de latencias; F3 exporta CSV y Chrome trace
+PROFILER_OVERLAY = False
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perfiles")
+
+# --- ZONAS DE DETECCIÓN ---
+# Arrastrar con el botón izquierdo sobre el video agrega una zona; clic derecho las borra.
+# Sin zonas se analiza el cuadro completo.
+ZONES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "zonas.json")
+COLOR_ZONE_BGR = (0, 200, 255)
+
 class FaceRecognitionApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -50,23 +85,22 @@ class FaceRecognitionApp(tk.Tk):
         # --- ESTADO DEL SISTEMA ---
         self.view_mode = 'live'
         self.running = True
-        self.model_failed = False
+        self.tracker = OpticalFlowTracker()
+        self.motion_gate = MotionGate()
+
+        # Último cuadro publicado por el hilo de video: (rgb, (texto, color))
+        self.frame_lock = threading.Lock()
+        self.latest_frame = None
+        self.shown_status = None
+
+        # Zonas de interés en coordenadas de pantalla (640x480)
+        self.zones = self.load_zones()
+        self.zone_start = None
         
         # --- CARGAR MODELOS ---
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        
-        self.path_proto = os.path.join(BASE_DIR, "model", "MobileNetSSD_deploy.prototxt")
-        self.path_model = os.path.join(BASE_DIR, "model", "MobileNetSSD_deploy.caffemodel")
-        
-        self.net = None
-        
-        # Clases en INGLÉS (como está entrenado el modelo)
-        self.CLASSES = ["background", "aeroplane", "bicycle", "bird", "boat",
-                        "bottle", "bus", "car", "cat", "chair", "cow", "diningtable",
-                        "dog", "horse", "motorbike", "person", "pottedplant", "sheep",
-                        "sofa", "train", "tvmonitor"]
-        
-        self.load_mobilenet()
+        self.profiler = StageProfiler()
+        self.show_profiler = PROFILER_OVERLAY
+        self.pipeline = DetectionPipeline(profiler=self.profiler)
 
         self.setup_styles()
         self.create_widgets()
@@ -82,24 +116,12 @@ class FaceRecognitionApp(tk.Tk):
         self.video_thread.start()
         
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
-
-    def load_mobilenet(self):
-        print(f"\n--- DIAGNÓSTICO DE MODELO ---")
-        try:
-            if os.path.exists(self.path_proto) and os.path.exists(self.path_model):
-                size_proto = os.path.getsize(self.path_proto)
-                size_model = os.path.getsize(self.path_model)
-                
-                if size_proto > 0 and size_model > 0:
-                    self.net = cv2.dnn.readNetFromCaffe(self.path_proto, self.path_model)
-                    print(">>> ÉXITO: Modelo MobileNet cargado correctamente.\n")
-                else:
-                    print(">>> ERROR: Archivos VACÍOS (0kb).\n")
-            else:
-                print(">>> ERROR: Archivos no encontrados en carpeta 'model'.\n")
-        except Exception as e:
-            print(f">>> EXCEPCIÓN: {e}\n")
-            self.net = None
+        self.bind("<F2>", lambda e: self.toggle_profiler())
+        self.bind("<F3>", lambda e: self.export_profile())
+        self.video_label.bind("<ButtonPress-1>", self.on_zone_start)
+        self.video_label.bind("<ButtonRelease-1>", self.on_zone_end)
+        self.video_label.bind("<Button-3>", self.on_zones_clear)
+        self.refresh_video()
 
     def setup_styles(self):
         self.style = ttk.Style(self)
@@ -129,7 +151,9 @@ class FaceRecognitionApp(tk.Tk):
         self.camera_frame.pack()
         self.camera_frame.pack_propagate(False)
 
-        self.video_label = tk.Label(self.camera_frame, bg="black")
+        # Una sola PhotoImage persistente; cada cuadro se pega encima con paste()
+        self.photo = ImageTk.PhotoImage("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+        self.video_label = tk.Label(self.camera_frame, bg="black", image=self.photo)
         self.video_label.place(x=0, y=0, width=640, height=480)
         
         controls_card = ttk.Frame(main_content, style="Card.TFrame", padding=10)
@@ -149,190 +173,189 @@ class FaceRecognitionApp(tk.Tk):
 
     def reset_to_camera(self):
         self.view_mode = 'live'
+        self.shown_status = None
         self.btn_action.config(text="📂 CARGAR IMAGEN PARA ANALIZAR", cursor="hand2")
         self.update_status("Cámara activa.", COLOR_TEXT_BODY)
 
     def process_frame_for_objects(self, image):
-        detected_types = []
-        
-        # 1. PERSONAS (Face Recognition)
-        try:
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            if self.view_mode == 'live':
-                small = cv2.resize(image, (0, 0), fx=0.5, fy=0.5)
-                rgb_small = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
-                locs = face_recognition.face_locations(rgb_small)
-                face_locations = [(t*2, r*2, b*2, l*2) for (t, r, b, l) in locs]
-            else:
-                face_locations = face_recognition.face_locations(rgb_image)
-
-            if face_locations:
-                detected_types.append("PERSONA")
-                for (top, right, bottom, left) in face_locations:
-                    cv2.rectangle(image, (left, top), (right, bottom), (0, 255, 0), 2)
-                    label = "PERSONA"
-                    (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_DUPLEX, 0.6, 1)
-                    cv2.rectangle(image, (left, bottom - 25), (left + w + 10, bottom), (0, 255, 0), cv2.FILLED)
-                    cv2.putText(image, label, (left + 5, bottom - 6), cv2.FONT_HERSHEY_DUPLEX, 0.6, (255, 255, 255), 1)
-        except: 
-            pass
+        image, detected_types, _, _, _ = self.pipeline.process_frame_for_objects(image, self.view_mode)
+        return image, detected_types
 
-        # 2. ANIMALES (MobileNet)
-        if self.net and not self.model_failed:
-            try:
-                (h_img, w_img) = image.shape[:2]
-                
-                # MEJORA: Procesamiento multi-escala para mejor detección
-                detecciones_totales = []
-                
-                # Procesar en múltiples escalas
-                escalas = [300, 400, 500] if self.view_mode == 'static' else [300]
-                
-                for escala in escalas:
-                    blob = cv2.dnn.blobFromImage(
-                        cv2.resize(image, (escala, escala)), 
-                        0.007843, 
-                        (escala, escala), 
-                        127.5
-                    )
-                    self.net.setInput(blob)
-                    detections = self.net.forward()
-                    
-                    for i in range(detections.shape[2]):
-                        confidence = detections[0, 0, i, 2]
-                        
-                        # UMBRAL AJUSTADO: 30% para balance entre detección y precisión
-                        if confidence > 0.30:
-                            idx = int(detections[0, 0, i, 1])
-                            
-                            if 0 <= idx < len(self.CLASSES):
-                                label = self.CLASSES[idx]
-                                
-                                # Solo animales
-                                animales = ["bird", "cat", "cow", "dog", "horse", "sheep"]
-                                
-                                if label in animales:
-                                    box = detections[0, 0, i, 3:7] * np.array([w_img, h_img, w_img, h_img])
-                                    (startX, startY, endX, endY) = box.astype("int")
-                                    
-                                    # Validar coordenadas
-                                    startX = max(0, startX)
-                                    startY = max(0, startY)
-                                    endX = min(w_img, endX)
-                                    endY = min(h_img, endY)
-                                    
-                                    #VALIDAR TAMAÑO MÍNIMO (evitar detecciones muy pequeñas)
-                                    ancho = endX - startX
-                                    alto = endY - startY
-                                    area = ancho * alto
-                                    area_img = w_img * h_img
-                                    porcentaje_area = (area / area_img) * 100
-                                    
-                                    # Descartar si es menor al 1% del área total (probablemente error)
-                                    if porcentaje_area < 1.0:
-                                        continue
-                                    
-                                    # Evitar duplicados y superposiciones
-                                    es_duplicado = False
-                                    for det in detecciones_totales:
-                                        # Calcular IoU (Intersection over Union)
-                                        x1 = max(det['startX'], startX)
-                                        y1 = max(det['startY'], startY)
-                                        x2 = min(det['endX'], endX)
-                                        y2 = min(det['endY'], endY)
-                                        
-                                        interseccion = max(0, x2 - x1) * max(0, y2 - y1)
-                                        area_det = (det['endX'] - det['startX']) * (det['endY'] - det['startY'])
-                                        union = area + area_det - interseccion
-                                        
-                                        iou = interseccion / union if union > 0 else 0
-                                        
-                                        # Si hay más de 30% de superposición, es duplicado
-                                        if iou > 0.3:
-                                            # Mantener el de mayor confianza
-                                            if confidence > det['confidence']:
-                                                detecciones_totales.remove(det)
-                                            else:
-                                                es_duplicado = True
-                                            break
-                                    
-                                    if not es_duplicado:
-                                        detecciones_totales.append({
-                                            'startX': startX,
-                                            'startY': startY,
-                                            'endX': endX,
-                                            'endY': endY,
-                                            'label': label,
-                                            'confidence': confidence,
-                                            'area': porcentaje_area
-                                        })
-                
-                # Dibujar todas las detecciones
-                if detecciones_totales:
-                    detected_types.append("ANIMAL")
-                    
-                    for det in detecciones_totales:
-                        cv2.rectangle(image, (det['startX'], det['startY']), 
-                                    (det['endX'], det['endY']), (255, 0, 255), 2)
-                        
-                        # Solo mostrar "ANIMAL"
-                        txt = "ANIMAL"
-                        (w, h), _ = cv2.getTextSize(txt, cv2.FONT_HERSHEY_DUPLEX, 0.6, 1)
-                        cv2.rectangle(image, (det['startX'], det['startY'] - 25), 
-                                    (det['startX'] + w + 10, det['startY']), (255, 0, 255), cv2.FILLED)
-                        cv2.putText(image, txt, (det['startX'] + 5, det['startY'] - 6), 
-                                  cv2.FONT_HERSHEY_DUPLEX, 0.6, (255, 255, 255), 1)
-                        
-                        print(f"✅ Detectado: {det['label']} con confianza {det['confidence']*100:.1f}% (área: {det['area']:.1f}%)")
-                        
-            except Exception as e:
-                print(f"Error en detección de animales: {e}")
-                self.model_failed = True
+    def track_objects(self, gray, face_locations, detecciones):
+        """Desplaza las últimas detecciones con el tracker; None si hay que re-detectar."""
+        boxes, confianza = self.tracker.update(gray)
+        # Las cajas sin textura (sin puntos) no fuerzan re-detección: siguen fijas
+        confianza = confianza[self.tracker.trackable]
+        if len(confianza) and confianza.min() < MIN_TRACK_CONFIDENCE:
+            return None
 
-        return image, detected_types
+        boxes = boxes.round().astype(np.int32)
+        n_faces = len(face_locations)
+        face_locations = [(y1, x2, y2, x1) for (x1, y1, x2, y2) in boxes[:n_faces].tolist()]
+
+        detecciones = detecciones.copy()
+        detecciones['startX'] = boxes[n_faces:, 0]
+        detecciones['startY'] = boxes[n_faces:, 1]
+        detecciones['endX'] = boxes[n_faces:, 2]
+        detecciones['endY'] = boxes[n_faces:, 3]
+        return face_locations, detecciones
 
     def video_loop(self):
-        process_this_frame = True
+        frames_since_detection = DETECT_EVERY_N_FRAMES
+        face_locations, detecciones, face_names = [], empty_detections(), []
+        last_stats_time = time.time()
         
         while self.running:
             if self.view_mode == 'static':
+                frames_since_detection = DETECT_EVERY_N_FRAMES
+                self.motion_gate.reset()
                 time.sleep(0.1)
                 continue
 
-            ret, frame = self.cap.read()
+            t_frame = time.perf_counter()
+            self.profiler.begin_frame()
+            with self.profiler.stage('capture'):
+                ret, frame = self.cap.read()
             if not ret:
                 time.sleep(0.1)
                 continue
             
-            frame = cv2.flip(frame, 1)
-            display_frame = frame.copy()
-
-            if process_this_frame:
-                display_frame, detected = self.process_frame_for_objects(display_frame)
-                
-                if "PERSONA" in detected and "ANIMAL" in detected:
-                    self.update_status("PERSONA Y ANIMAL DETECTADOS", COLOR_SUCCESS)
-                elif "PERSONA" in detected:
-                    self.update_status("PERSONA DETECTADA", COLOR_SUCCESS)
-                elif "ANIMAL" in detected:
-                    self.update_status("ANIMAL DETECTADO", COLOR_ANIMAL)
+            zones = self.frame_zones(frame.shape)
+
+            with self.profiler.stage('preprocess'):
+                frame = cv2.flip(frame, 1)
+                display_frame = frame.copy()
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+            with self.profiler.stage('motion_gate'):
+                process = not MOTION_GATE_ENABLED or self.motion_gate.should_process(gray, zones=zones)
+
+            # Escena sin cambios: se reutilizan las detecciones anteriores
+            if process:
+                # Detectar cada N cuadros; en medio solo seguir las cajas
+                tracked = None
+                if frames_since_detection < DETECT_EVERY_N_FRAMES:
+                    with self.profiler.stage('tracking'):
+                        tracked = self.track_objects(gray, face_locations, detecciones)
+
+                if tracked is None:
+                    face_locations, detecciones = self.pipeline.detect_objects(frame, 'live', zones)
+                    face_names = self.pipeline.identify_faces(frame, face_locations)
+                    boxes = [(l, t, r, b) for (t, r, b, l) in face_locations]
+                    boxes += [(d['startX'], d['startY'], d['endX'], d['endY']) for d in detecciones]
+                    self.tracker.init(gray, boxes)
+                    frames_since_detection = 1
                 else:
-                    self.update_status("BUSCANDO...", COLOR_WARNING)
+                    face_locations, detecciones = tracked
+                    frames_since_detection += 1
+
+            if MOTION_GATE_ENABLED and time.time() - last_stats_time >= GATE_STATS_INTERVAL:
+                last_stats_time = time.time()
+                s = self.motion_gate.stats()
+                print(f"Compuerta: {s['processed']}/{s['frames']} cuadros inferidos, "
+                      f"{s['skip_rate']*100:.0f}% omitidos, {s['forced_by_staleness']} por vencimiento, "
+                      f"movimiento actual {s['last_motion_fraction']*100:.2f}%")
+
+            with self.profiler.stage('drawing'):
+                detected = self.pipeline.draw_detections(display_frame, face_locations, detecciones, face_names)
+                for (x1, y1, x2, y2) in zones:
+                    cv2.rectangle(display_frame, (x1, y1), (x2, y2), COLOR_ZONE_BGR, 1)
             
-            try:
-                img = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(img)
-                img_tk = ImageTk.PhotoImage(image=img)
-                
-                if hasattr(self, 'video_label') and self.view_mode == 'live':
-                    self.video_label.configure(image=img_tk)
-                    self.video_label.image = img_tk
-            except: 
-                pass
+            if "PERSONA" in detected and "ANIMAL" in detected:
+                status = ("PERSONA Y ANIMAL DETECTADOS", COLOR_SUCCESS)
+            elif "PERSONA" in detected:
+                status = ("PERSONA DETECTADA", COLOR_SUCCESS)
+            elif "ANIMAL" in detected:
+                status = ("ANIMAL DETECTADO", COLOR_ANIMAL)
+            else:
+                status = ("BUSCANDO...", COLOR_WARNING)
+
+            # El hilo de video no toca Tk: solo publica el último cuadro
+            if display_frame.shape[:2] != (DISPLAY_HEIGHT, DISPLAY_WIDTH):
+                display_frame = cv2.resize(display_frame, (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+            if self.show_profiler:
+                self.profiler.draw_overlay(display_frame)
+            with self.profiler.stage('display_convert'):
+                rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
+            with self.frame_lock:
+                self.latest_frame = (rgb, status)
+            self.profiler.record('frame_total', t_frame, time.perf_counter())
             
             time.sleep(0.015)
 
+    def refresh_video(self):
+        """Corre en el hilo de Tk: pega el último cuadro publicado en la PhotoImage."""
+        with self.frame_lock:
+            item, self.latest_frame = self.latest_frame, None
+
+        if item is not None and self.view_mode == 'live':
+            rgb, status = item
+            try:
+                with self.profiler.stage('tk_presentation'):
+                    self.photo.paste(Image.frombuffer("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT),
+                                                      rgb, "raw", "RGB", 0, 1))
+                if status != self.shown_status:
+                    self.shown_status = status
+                    self.status_label.config(text=status[0], foreground=status[1])
+            except tk.TclError:
+                pass
+
+        if self.running:
+            self.after(DISPLAY_INTERVAL_MS, self.refresh_video)
+
+    def load_zones(self):
+        try:
+            with open(ZONES_PATH, encoding="utf-8") as f:
+                return [tuple(z) for z in json.load(f)]
+        except (OSError, ValueError):
+            return []
+
+    def save_zones(self):
+        os.makedirs(os.path.dirname(ZONES_PATH), exist_ok=True)
+        with open(ZONES_PATH, "w", encoding="utf-8") as f:
+            json.dump(self.zones, f)
+
+    def frame_zones(self, shape):
+        """Zonas escaladas de pantalla (640x480) a la resolución de la cámara."""
+        h, w = shape[:2]
+        sx, sy = w / DISPLAY_WIDTH, h / DISPLAY_HEIGHT
+        return [(int(x1*sx), int(y1*sy), int(x2*sx), int(y2*sy)) for (x1, y1, x2, y2) in self.zones]
+
+    def on_zone_start(self, event):
+        if self.view_mode == 'live':
+            self.zone_start = (event.x, event.y)
+
+    def on_zone_end(self, event):
+        if self.zone_start is None:
+            return
+        (x0, y0), self.zone_start = self.zone_start, None
+        x1, x2 = max(0, min(x0, event.x)), min(DISPLAY_WIDTH, max(x0, event.x))
+        y1, y2 = max(0, min(y0, event.y)), min(DISPLAY_HEIGHT, max(y0, event.y))
+        if x2 - x1 < 20 or y2 - y1 < 20:
+            return
+        self.zones = self.zones + [(x1, y1, x2, y2)]
+        self.save_zones()
+        self.update_status(f"Zona agregada ({len(self.zones)} en total)", COLOR_TEXT_BODY)
+
+    def on_zones_clear(self, event):
+        self.zones = []
+        self.save_zones()
+        self.update_status("Zonas borradas: se analiza el cuadro completo", COLOR_TEXT_BODY)
+
+    def toggle_profiler(self):
+        self.show_profiler = not self.show_profiler
+
+    def export_profile(self):
+        """Guarda los eventos medidos como CSV y Chrome trace (chrome://tracing)."""
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        csv_path = os.path.join(PROFILE_DIR, f"perfil_{stamp}.csv")
+        trace_path = os.path.join(PROFILE_DIR, f"perfil_{stamp}.json")
+        self.profiler.export_csv(csv_path)
+        self.profiler.export_chrome_trace(trace_path)
+        print(f"Perfil exportado: {csv_path}, {trace_path}")
+        self.update_status("Perfil exportado en 'perfiles/'", COLOR_TEXT_BODY)
+
     def analyze_image_file(self):
         self.view_mode = 'static'
         
@@ -372,11 +395,7 @@ class FaceRecognitionApp(tk.Tk):
             final_display[y_offset:y_offset+new_h, x_offset:x_offset+new_w] = processed_image
 
             img_rgb = cv2.cvtColor(final_display, cv2.COLOR_BGR2RGB)
-            img_pil = Image.fromarray(img_rgb)
-            img_tk = ImageTk.PhotoImage(image=img_pil)
-            
-            self.video_label.configure(image=img_tk)
-            self.video_label.image = img_tk
+            self.photo.paste(Image.fromarray(img_rgb))
 
             self.btn_action.config(text="🎥 VOLVER A CÁMARA", cursor="hand2")
             
@@ -0,0 +1,109 @@
+import argparse
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+
+from detectores_rostro import FACE_DETECTORS, create_face_detector
+
+IMAGE_EXTENSIONS = ("*.jpg", "*.jpeg", "*.png")
+IOU_MATCH = 0.5
+
+
+def load_dataset(folder):
+    """Carga pares (imagen, cajas) de la carpeta.
+
+    Cada imagen 'foto.jpg' lleva al lado 'foto.txt' con un rostro por línea
+    en formato 'x1 y1 x2 y2'. Imágenes sin .txt se consideran sin rostros.
+    """
+    paths = sorted(p for ext in IMAGE_EXTENSIONS for p in glob.glob(os.path.join(folder, ext)))
+    dataset = []
+    for path in paths:
+        image = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            print(f"Aviso: no se pudo leer '{path}'")
+            continue
+        label_path = os.path.splitext(path)[0] + ".txt"
+        boxes = np.loadtxt(label_path, ndmin=2) if os.path.exists(label_path) else np.empty((0, 4))
+        dataset.append((image, boxes.reshape(-1, 4)))
+    return dataset
+
+
+def iou_matrix(a, b):
+    """IoU entre todas las cajas (x1, y1, x2, y2) de a y b."""
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
+def benchmark(detector, dataset, scale, warmup=2):
+    tiempos = []
+    encontrados = total = falsos = 0
+
+    for image, _ in dataset[:warmup]:
+        detector.detect(image, scale)
+
+    for image, gt in dataset:
+        t0 = time.perf_counter()
+        locs = detector.detect(image, scale)
+        tiempos.append((time.perf_counter() - t0) * 1000)
+
+        pred = np.array([(l, t, r, b) for (t, r, b, l) in locs], dtype=np.float64).reshape(-1, 4)
+        total += len(gt)
+        if len(gt) and len(pred):
+            iou = iou_matrix(gt, pred)
+            hits = int((iou.max(axis=1) >= IOU_MATCH).sum())
+        else:
+            hits = 0
+        encontrados += hits
+        falsos += max(0, len(pred) - hits)
+
+    tiempos = np.array(tiempos)
+    return {
+        "backend": detector.name,
+        "imagenes": len(dataset),
+        "media_ms": float(tiempos.mean()) if len(tiempos) else 0.0,
+        "p50_ms": float(np.percentile(tiempos, 50)) if len(tiempos) else 0.0,
+        "p95_ms": float(np.percentile(tiempos, 95)) if len(tiempos) else 0.0,
+        "recall": encontrados / total if total else 0.0,
+        "falsos_positivos": falsos,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara backends de detección de rostros.")
+    parser.add_argument("carpeta", help="Carpeta con imágenes y etiquetas .txt")
+    parser.add_argument("--backends", nargs="+", default=list(FACE_DETECTORS),
+                        choices=list(FACE_DETECTORS))
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Escala de entrada (la app en vivo usa 0.5)")
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.carpeta)
+    if not dataset:
+        print(f"Error: no hay imágenes en '{args.carpeta}'.")
+        return
+
+    print(f"{'BACKEND':<10} {'MEDIA ms':>9} {'P50 ms':>8} {'P95 ms':>8} {'RECALL':>7} {'FP':>5}")
+    print("-" * 52)
+    for name in args.backends:
+        try:
+            detector = create_face_detector(name)
+        except Exception as e:
+            print(f"{name:<10} no disponible: {e}")
+            continue
+        r = benchmark(detector, dataset, args.scale)
+        print(f"{r['backend']:<10} {r['media_ms']:>9.1f} {r['p50_ms']:>8.1f} "
+              f"{r['p95_ms']:>8.1f} {r['recall']:>7.2%} {r['falsos_positivos']:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import cv2
+import numpy as np
+
+from perfilador import NULL_PROFILER
+
+# Clases en INGLÉS (como está entrenado el modelo)
+CLASSES = ["background", "aeroplane", "bicycle", "bird", "boat",
+           "bottle", "bus", "car", "cat", "chair", "cow", "diningtable",
+           "dog", "horse", "motorbike", "person", "pottedplant", "sheep",
+           "sofa", "train", "tvmonitor"]
+
+ANIMALES = ["bird", "cat", "cow", "dog", "horse", "sheep"]
+ANIMAL_IDS = np.array([CLASSES.index(a) for a in ANIMALES], dtype=np.int16)
+
+# UMBRAL AJUSTADO: 30% para balance entre detección y precisión
+CONF_THRESHOLD = 0.30
+# Descartar si es menor al 1% del área total (probablemente error)
+MIN_AREA_PCT = 1.0
+# Si hay más de 30% de superposición, es duplicado
+NMS_IOU_THRESHOLD = 0.3
+
+DETECTION_DTYPE = np.dtype([
+    ('startX', np.int32),
+    ('startY', np.int32),
+    ('endX', np.int32),
+    ('endY', np.int32),
+    ('class_id', np.int16),
+    ('confidence', np.float32),
+    ('area', np.float32),
+])
+
+
+def empty_detections():
+    """Arreglo estructurado vacío de detecciones."""
+    return np.empty(0, dtype=DETECTION_DTYPE)
+
+
+def filter_ssd_output(detections, w_img, h_img, class_ids=ANIMAL_IDS,
+                      conf_threshold=CONF_THRESHOLD, min_area_pct=MIN_AREA_PCT, frame_area=None):
+    """Filtra la salida cruda del SSD (1x1xNx7) con máscaras de NumPy.
+
+    'frame_area' es el área del cuadro completo cuando la imagen es un
+    recorte (zonas): el porcentaje de área se mide siempre sobre el cuadro.
+    """
+    raw = detections.reshape(-1, 7)
+    confidence = raw[:, 2]
+    class_idx = raw[:, 1].astype(np.int16)
+
+    mask = (confidence > conf_threshold) & np.isin(class_idx, class_ids)
+    if not mask.any():
+        return empty_detections()
+
+    raw = raw[mask]
+    boxes = (raw[:, 3:7] * np.array([w_img, h_img, w_img, h_img])).astype(np.int32)
+
+    # Validar coordenadas
+    boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, w_img)
+    boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, h_img)
+
+    # VALIDAR TAMAÑO MÍNIMO (evitar detecciones muy pequeñas)
+    ancho = np.maximum(boxes[:, 2] - boxes[:, 0], 0)
+    alto = np.maximum(boxes[:, 3] - boxes[:, 1], 0)
+    porcentaje_area = (ancho * alto) / float(frame_area or w_img * h_img) * 100
+    keep = porcentaje_area >= min_area_pct
+
+    out = np.empty(int(keep.sum()), dtype=DETECTION_DTYPE)
+    out['startX'] = boxes[keep, 0]
+    out['startY'] = boxes[keep, 1]
+    out['endX'] = boxes[keep, 2]
+    out['endY'] = boxes[keep, 3]
+    out['class_id'] = raw[keep, 1]
+    out['confidence'] = raw[keep, 2]
+    out['area'] = porcentaje_area[keep]
+    return out
+
+
+def nms_per_class(dets, iou_threshold=NMS_IOU_THRESHOLD):
+    """Supresión de no-máximos por clase con cv2.dnn.NMSBoxes."""
+    if len(dets) < 2:
+        return dets
+
+    keep = []
+    for class_id in np.unique(dets['class_id']):
+        idx = np.flatnonzero(dets['class_id'] == class_id)
+        d = dets[idx]
+        boxes = np.stack([d['startX'], d['startY'],
+                          d['endX'] - d['startX'], d['endY'] - d['startY']], axis=1)
+        selected = cv2.dnn.NMSBoxes(boxes.tolist(), d['confidence'].tolist(),
+                                    0.0, iou_threshold)
+        keep.append(idx[np.asarray(selected, dtype=np.int64).reshape(-1)])
+
+    keep = np.concatenate(keep)
+    result = dets[keep]
+    # Orden estable: mayor confianza primero
+    return result[np.argsort(-result['confidence'], kind='stable')]
+
+
+def detect_animals(net, image, escalas=(300,), profiler=NULL_PROFILER, frame_area=None):
+    """Ejecuta MobileNet SSD en varias escalas y devuelve detecciones sin duplicados."""
+    (h_img, w_img) = image.shape[:2]
+    parciales = []
+
+    for escala in escalas:
+        with profiler.stage('ssd_blob'):
+            blob = cv2.dnn.blobFromImage(
+                cv2.resize(image, (escala, escala)),
+                0.007843,
+                (escala, escala),
+                127.5
+            )
+        with profiler.stage('ssd_forward'):
+            net.setInput(blob)
+            detections = net.forward()
+        with profiler.stage('ssd_filter'):
+            parciales.append(filter_ssd_output(detections, w_img, h_img, frame_area=frame_area))
+
+    with profiler.stage('ssd_nms'):
+        dets = np.concatenate(parciales) if parciales else empty_detections()
+        return nms_per_class(dets)
+
+
+def offset_detections(dets, dx, dy):
+    """Traslada detecciones de un recorte a coordenadas del cuadro completo."""
+    dets = dets.copy()
+    dets['startX'] += dx
+    dets['endX'] += dx
+    dets['startY'] += dy
+    dets['endY'] += dy
+    return dets
+
+
+def dedupe_face_locations(face_locations, iou_threshold=0.5):
+    """Quita rostros repetidos (p. ej. en zonas superpuestas)."""
+    if len(face_locations) < 2:
+        return face_locations
+    boxes = [[l, t, r - l, b - t] for (t, r, b, l) in face_locations]
+    keep = cv2.dnn.NMSBoxes(boxes, [1.0] * len(boxes), 0.0, iou_threshold)
+    return [face_locations[i] for i in sorted(np.asarray(keep).reshape(-1).tolist())]
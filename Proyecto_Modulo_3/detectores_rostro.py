@@ -0,0 +1,140 @@
+import os
+import cv2
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_DIR = os.path.join(BASE_DIR, "model")
+
+# Modelo res10 SSD de OpenCV (ver Ejecucion.txt)
+RES10_PROTO = os.path.join(MODEL_DIR, "res10_deploy.prototxt")
+RES10_MODEL = os.path.join(MODEL_DIR, "res10_300x300_ssd_iter_140000.caffemodel")
+
+
+class FaceDetector:
+    """Interfaz común: detect() devuelve [(top, right, bottom, left), ...] en BGR."""
+
+    name = "base"
+
+    def __init__(self, scale=1.0):
+        self.scale = scale
+
+    def _detect(self, bgr):
+        raise NotImplementedError
+
+    def detect(self, image, scale=None):
+        scale = self.scale if scale is None else scale
+        if scale != 1.0:
+            small = cv2.resize(image, (0, 0), fx=scale, fy=scale)
+        else:
+            small = image
+
+        locs = self._detect(small)
+        if scale == 1.0:
+            return locs
+        inv = 1.0 / scale
+        return [(int(t*inv), int(r*inv), int(b*inv), int(l*inv)) for (t, r, b, l) in locs]
+
+
+class HogFaceDetector(FaceDetector):
+    """dlib HOG a través de face_recognition."""
+
+    name = "hog"
+
+    def __init__(self, scale=1.0):
+        super().__init__(scale)
+        import face_recognition
+        self._face_locations = face_recognition.face_locations
+
+    def _detect(self, bgr):
+        rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        return self._face_locations(rgb)
+
+
+class DnnFaceDetector(FaceDetector):
+    """OpenCV DNN con el SSD res10 300x300."""
+
+    name = "dnn"
+
+    def __init__(self, scale=1.0, conf_threshold=0.5,
+                 proto=RES10_PROTO, model=RES10_MODEL):
+        super().__init__(scale)
+        if not (os.path.exists(proto) and os.path.exists(model)):
+            raise FileNotFoundError(f"Modelo res10 no encontrado en '{MODEL_DIR}'")
+        self.net = cv2.dnn.readNetFromCaffe(proto, model)
+        self.conf_threshold = conf_threshold
+
+    def _detect(self, bgr):
+        h, w = bgr.shape[:2]
+        blob = cv2.dnn.blobFromImage(cv2.resize(bgr, (300, 300)), 1.0,
+                                     (300, 300), (104.0, 177.0, 123.0))
+        self.net.setInput(blob)
+        raw = self.net.forward().reshape(-1, 7)
+        raw = raw[raw[:, 2] > self.conf_threshold]
+
+        boxes = (raw[:, 3:7] * np.array([w, h, w, h])).astype(np.int32)
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, w)
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, h)
+        return [(y1, x2, y2, x1) for (x1, y1, x2, y2) in boxes.tolist()]
+
+
+class HaarFaceDetector(FaceDetector):
+    """Cascada Haar frontal incluida con OpenCV."""
+
+    name = "haar"
+
+    def __init__(self, scale=1.0, min_size=(30, 30)):
+        super().__init__(scale)
+        path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
+        self.cascade = cv2.CascadeClassifier(path)
+        self.min_size = min_size
+
+    def _detect(self, bgr):
+        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+        faces = self.cascade.detectMultiScale(gray, scaleFactor=1.1,
+                                              minNeighbors=5, minSize=self.min_size)
+        return [(y, x + w, y + h, x) for (x, y, w, h) in np.asarray(faces).reshape(-1, 4).tolist()]
+
+
+class MediaPipeFaceDetector(FaceDetector):
+    """MediaPipe Face Detection (modelo de corto alcance)."""
+
+    name = "mediapipe"
+
+    def __init__(self, scale=1.0, min_confidence=0.5):
+        super().__init__(scale)
+        try:
+            import mediapipe as mp
+        except ImportError:
+            raise ImportError("El backend 'mediapipe' requiere: pip install mediapipe")
+        self.detector = mp.solutions.face_detection.FaceDetection(
+            model_selection=0, min_detection_confidence=min_confidence)
+
+    def _detect(self, bgr):
+        h, w = bgr.shape[:2]
+        results = self.detector.process(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+        locs = []
+        for det in results.detections or []:
+            bb = det.location_data.relative_bounding_box
+            left = max(0, int(bb.xmin * w))
+            top = max(0, int(bb.ymin * h))
+            right = min(w, int((bb.xmin + bb.width) * w))
+            bottom = min(h, int((bb.ymin + bb.height) * h))
+            locs.append((top, right, bottom, left))
+        return locs
+
+
+FACE_DETECTORS = {
+    HogFaceDetector.name: HogFaceDetector,
+    DnnFaceDetector.name: DnnFaceDetector,
+    HaarFaceDetector.name: HaarFaceDetector,
+    MediaPipeFaceDetector.name: MediaPipeFaceDetector,
+}
+
+
+def create_face_detector(name, **kwargs):
+    """Crea el backend de detección de rostros por nombre."""
+    try:
+        cls = FACE_DETECTORS[name]
+    except KeyError:
+        raise ValueError(f"Backend desconocido '{name}'. Opciones: {', '.join(FACE_DETECTORS)}")
+    return cls(**kwargs)
@@ -0,0 +1,51 @@
+import os
+import glob
+
+import face_recognition
+import numpy as np
+
+from galeria_rostros import BASE_DIR, FaceGallery
+
+ENROLL_DIR = os.path.join(BASE_DIR, "data", "rostros")
+
+
+def enrolar_carpeta(carpeta=ENROLL_DIR):
+    """
+    Enrola rostros desde data/rostros/<nombre>/*.jpg.
+    Las imágenes ya enroladas se omiten, así que solo se calculan las nuevas.
+    """
+    galeria = FaceGallery()
+    print(f"Galería actual: {len(galeria)} rostros")
+
+    nuevos = 0
+    for persona_dir in sorted(glob.glob(os.path.join(carpeta, "*"))):
+        if not os.path.isdir(persona_dir):
+            continue
+        nombre = os.path.basename(persona_dir).upper()
+
+        for path in sorted(glob.glob(os.path.join(persona_dir, "*"))):
+            source = os.path.relpath(path, BASE_DIR)
+            if galeria.has_source(source):
+                continue
+            try:
+                image = face_recognition.load_image_file(path)
+            except Exception as e:
+                print(f"Aviso: no se pudo leer '{path}': {e}")
+                continue
+
+            encodings = face_recognition.face_encodings(image)
+            if len(encodings) != 1:
+                print(f"Aviso: '{path}' tiene {len(encodings)} rostros, se omite.")
+                continue
+
+            galeria.enroll(nombre, np.asarray(encodings[0]), source)
+            nuevos += 1
+            print(f"Enrolado: {nombre} ({source})")
+
+    if nuevos:
+        galeria.save()
+    print(f"Nuevos: {nuevos}. Total en galería: {len(galeria)}")
+
+
+if __name__ == "__main__":
+    enrolar_carpeta()
@@ -0,0 +1,72 @@
+import os
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GALLERY_PATH = os.path.join(BASE_DIR, "data", "galeria_rostros.npz")
+
+# Tolerancia por defecto de face_recognition.compare_faces
+MATCH_TOLERANCE = 0.6
+UNKNOWN_LABEL = "PERSONA"
+
+
+class FaceGallery:
+    """Galería de rostros enrolados: matriz float32 (N, 128) + nombres."""
+
+    def __init__(self, path=GALLERY_PATH):
+        self.path = path
+        self.encodings = np.empty((0, 128), dtype=np.float32)
+        self.names = []
+        self.sources = []
+        self._source_set = set()
+        self._sq_norms = np.empty(0, dtype=np.float32)
+        self.load()
+
+    def __len__(self):
+        return len(self.names)
+
+    def load(self):
+        """Carga la galería desde disco si existe."""
+        if not os.path.exists(self.path):
+            return
+        data = np.load(self.path, allow_pickle=False)
+        self.encodings = data["encodings"].astype(np.float32)
+        self.names = data["names"].tolist()
+        self.sources = data["sources"].tolist()
+        self._source_set = set(self.sources)
+        self._sq_norms = np.einsum("ij,ij->i", self.encodings, self.encodings)
+
+    def save(self):
+        """Guarda la galería en un solo .npz compacto."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        np.savez(self.path, encodings=self.encodings,
+                 names=np.array(self.names, dtype=str),
+                 sources=np.array(self.sources, dtype=str))
+
+    def has_source(self, source):
+        return source in self._source_set
+
+    def enroll(self, name, encoding, source=""):
+        """Agrega una codificación sin recalcular las existentes."""
+        enc = np.asarray(encoding, dtype=np.float32).reshape(1, 128)
+        self.encodings = np.vstack([self.encodings, enc])
+        self._sq_norms = np.append(self._sq_norms, np.float32(enc @ enc.T))
+        self.names.append(name)
+        self.sources.append(source)
+        self._source_set.add(source)
+
+    def identify(self, encodings, tolerance=MATCH_TOLERANCE):
+        """Devuelve un nombre por codificación consultada (UNKNOWN_LABEL si no hay match)."""
+        queries = np.asarray(encodings, dtype=np.float32).reshape(-1, 128)
+        if len(queries) == 0:
+            return []
+        if len(self.names) == 0:
+            return [UNKNOWN_LABEL] * len(queries)
+
+        # ||q - g||² = ||q||² + ||g||² - 2 q·g, en una sola multiplicación de matrices
+        q_sq = np.einsum("ij,ij->i", queries, queries)
+        d2 = q_sq[:, None] + self._sq_norms[None, :] - 2.0 * (queries @ self.encodings.T)
+        best = d2.argmin(axis=1)
+        best_dist = np.sqrt(np.maximum(d2[np.arange(len(queries)), best], 0.0))
+
+        return [self.names[j] if dist <= tolerance else UNKNOWN_LABEL
+                for j, dist in zip(best.tolist(), best_dist.tolist())]
@@ -0,0 +1,90 @@
+import time
+
+import cv2
+import numpy as np
+
+# Resolución reducida para comparar cuadros (muy barata)
+GATE_SIZE = (160, 120)
+# Diferencia de intensidad por píxel que cuenta como cambio
+PIXEL_DIFF_THRESHOLD = 25
+# Fracción de píxeles cambiados para considerar que hubo movimiento
+MOTION_FRACTION = 0.01
+# Aun sin movimiento, se vuelve a inferir pasado este tiempo
+MAX_STALE_SECONDS = 2.0
+
+
+class MotionGate:
+    """Decide si vale la pena correr los detectores comparando con el último cuadro procesado."""
+
+    def __init__(self, pixel_threshold=PIXEL_DIFF_THRESHOLD, motion_fraction=MOTION_FRACTION,
+                 max_stale_seconds=MAX_STALE_SECONDS):
+        self.pixel_threshold = pixel_threshold
+        self.motion_fraction = motion_fraction
+        self.max_stale_seconds = max_stale_seconds
+        self.reference = None
+        self.last_processed = 0.0
+        self.last_fraction = 0.0
+        self.frames = 0
+        self.processed = 0
+        self.skipped = 0
+        self.forced = 0
+        self._zones = None
+        self._zone_mask = None
+
+    def _mask_for(self, zones, shape):
+        """Máscara booleana de las zonas (coordenadas de 'shape') a la resolución GATE_SIZE."""
+        key = (tuple(map(tuple, zones)), shape[:2])
+        if key != self._zones:
+            h, w = shape[:2]
+            gw, gh = GATE_SIZE
+            sx, sy = gw / w, gh / h
+            mask = np.zeros((gh, gw), dtype=bool)
+            for (x1, y1, x2, y2) in zones:
+                mask[int(y1 * sy):int(np.ceil(y2 * sy)), int(x1 * sx):int(np.ceil(x2 * sx))] = True
+            self._zones, self._zone_mask = key, mask
+        return self._zone_mask
+
+    def should_process(self, gray, now=None, zones=None):
+        """True si hay movimiento o las detecciones previas están vencidas.
+
+        Con 'zones' [(x1, y1, x2, y2), ...] solo cuenta el movimiento dentro de ellas.
+        """
+        now = time.time() if now is None else now
+        small = cv2.GaussianBlur(cv2.resize(gray, GATE_SIZE, interpolation=cv2.INTER_AREA), (5, 5), 0)
+        self.frames += 1
+
+        if self.reference is None:
+            moved, stale = True, False
+        else:
+            changed = cv2.absdiff(small, self.reference) > self.pixel_threshold
+            if zones:
+                mask = self._mask_for(zones, gray.shape)
+                changed = changed[mask]
+            self.last_fraction = float(np.count_nonzero(changed)) / max(changed.size, 1)
+            moved = self.last_fraction >= self.motion_fraction
+            stale = now - self.last_processed >= self.max_stale_seconds
+
+        if not (moved or stale):
+            self.skipped += 1
+            return False
+
+        if stale and not moved:
+            self.forced += 1
+        self.reference = small
+        self.last_processed = now
+        self.processed += 1
+        return True
+
+    def reset(self):
+        """Olvida la referencia: el próximo cuadro se procesa siempre."""
+        self.reference = None
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "forced_by_staleness": self.forced,
+            "skip_rate": self.skipped / self.frames if self.frames else 0.0,
+            "last_motion_fraction": self.last_fraction,
+        }
@@ -0,0 +1,125 @@
+import csv
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import cv2
+import numpy as np
+
+# Muestras por etapa para los percentiles móviles
+WINDOW = 120
+# Eventos guardados para exportar (CSV / Chrome trace)
+MAX_EVENTS = 20000
+# Cada cuánto se recalcula el texto del overlay
+OVERLAY_REFRESH_SECONDS = 0.5
+
+
+class StageProfiler:
+    """Mide la duración de cada etapa del procesamiento.
+
+    Guarda una ventana móvil por etapa (percentiles) y un registro de
+    eventos exportable a CSV o al formato Chrome trace (chrome://tracing,
+    Perfetto). Es seguro usarlo desde varios hilos.
+    """
+
+    enabled = True
+
+    def __init__(self, window=WINDOW, max_events=MAX_EVENTS):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=window))
+        self.events = deque(maxlen=max_events)
+        self.last = {}
+        self.origin = time.perf_counter()
+        self._overlay_lines = []
+        self._overlay_time = 0.0
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def record(self, name, start, end):
+        ms = (end - start) * 1000
+        with self.lock:
+            self.samples[name].append(ms)
+            self.events.append((name, start - self.origin, end - start, threading.get_ident()))
+            self.last[name] = self.last.get(name, 0.0) + ms
+
+    def begin_frame(self):
+        """Limpia 'last' (ms por etapa del cuadro actual)."""
+        with self.lock:
+            self.last = {}
+
+    def percentiles(self):
+        """{etapa: (p50, p95, p99, n)} de la ventana móvil."""
+        with self.lock:
+            data = {k: np.fromiter(v, dtype=np.float64) for k, v in self.samples.items() if v}
+        return {k: (*np.percentile(v, [50, 95, 99]).tolist(), len(v)) for k, v in data.items()}
+
+    def draw_overlay(self, image, origin=(10, 10)):
+        """Dibuja una tabla semitransparente con p50/p95 por etapa."""
+        now = time.perf_counter()
+        if now - self._overlay_time >= OVERLAY_REFRESH_SECONDS:
+            self._overlay_time = now
+            self._overlay_lines = [f"{k:<18}{p50:6.1f}{p95:7.1f}"
+                                   for k, (p50, p95, _, _) in sorted(self.percentiles().items())]
+        lines = ["etapa (ms)         p50    p95"] + self._overlay_lines
+
+        x, y = origin
+        line_h = 16
+        w, h = 300, line_h * len(lines) + 8
+        h_img, w_img = image.shape[:2]
+        x2, y2 = min(x + w, w_img), min(y + h, h_img)
+        roi = image[y:y2, x:x2]
+        # Oscurecer solo el rectángulo del overlay
+        roi[:] = (roi * 0.35).astype(np.uint8)
+        for i, line in enumerate(lines):
+            cv2.putText(image, line, (x + 6, y + 16 + i * line_h), cv2.FONT_HERSHEY_PLAIN,
+                        1.0, (255, 255, 255), 1, cv2.LINE_AA)
+        return image
+
+    def export_csv(self, path):
+        """Un evento por fila: etapa, inicio, duración (ms) e hilo."""
+        with self.lock:
+            events = list(self.events)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["stage", "start_ms", "duration_ms", "thread"])
+            for name, start, dur, tid in events:
+                writer.writerow([name, f"{start*1000:.3f}", f"{dur*1000:.3f}", tid])
+
+    def export_chrome_trace(self, path):
+        """Eventos completos ('ph': 'X') en microsegundos."""
+        with self.lock:
+            events = list(self.events)
+        trace = [{"name": name, "ph": "X", "ts": start * 1e6, "dur": dur * 1e6,
+                  "pid": os.getpid(), "tid": tid, "cat": "pipeline"}
+                 for name, start, dur, tid in events]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+class NullProfiler:
+    """Perfilador que no mide nada (por defecto fuera de la app)."""
+
+    enabled = False
+    last = {}
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def record(self, name, start, end):
+        pass
+
+    def begin_frame(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,181 @@
+import os
+
+import cv2
+import face_recognition
+import numpy as np
+
+from deteccion import (CLASSES, detect_animals, empty_detections, nms_per_class,
+                       offset_detections, dedupe_face_locations)
+from detectores_rostro import create_face_detector
+from galeria_rostros import FaceGallery, UNKNOWN_LABEL
+from perfilador import StageProfiler
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PATH_PROTO = os.path.join(BASE_DIR, "model", "MobileNetSSD_deploy.prototxt")
+PATH_MODEL = os.path.join(BASE_DIR, "model", "MobileNetSSD_deploy.caffemodel")
+
+# --- DETECTOR DE ROSTROS ---
+# Opciones: "hog" (dlib), "dnn" (res10 SSD), "haar", "mediapipe"
+FACE_DETECTOR_BACKEND = "hog"
+
+
+def load_mobilenet(path_proto=PATH_PROTO, path_model=PATH_MODEL):
+    """Carga MobileNet SSD; devuelve None si los archivos faltan o están vacíos."""
+    print(f"\n--- DIAGNÓSTICO DE MODELO ---")
+    try:
+        if os.path.exists(path_proto) and os.path.exists(path_model):
+            size_proto = os.path.getsize(path_proto)
+            size_model = os.path.getsize(path_model)
+
+            if size_proto > 0 and size_model > 0:
+                net = cv2.dnn.readNetFromCaffe(path_proto, path_model)
+                print(">>> ÉXITO: Modelo MobileNet cargado correctamente.\n")
+                return net
+            print(">>> ERROR: Archivos VACÍOS (0kb).\n")
+        else:
+            print(">>> ERROR: Archivos no encontrados en carpeta 'model'.\n")
+    except Exception as e:
+        print(f">>> EXCEPCIÓN: {e}\n")
+    return None
+
+
+class DetectionPipeline:
+    """Detección de personas y animales sin dependencias de Tk.
+
+    Lo usan tanto la app como el análisis por lotes. 'mode' es 'live'
+    (rostros a 0.5x, SSD a una escala) o 'static' (resolución completa,
+    SSD multi-escala). Cada etapa se mide con 'profiler'; 'timings' da
+    los ms por etapa del último cuadro.
+    """
+
+    def __init__(self, face_backend=FACE_DETECTOR_BACKEND, verbose=True, profiler=None):
+        self.verbose = verbose
+        self.model_failed = False
+        self.profiler = profiler or StageProfiler()
+
+        self.net = load_mobilenet()
+        self.face_detector = self.load_face_detector(face_backend)
+        self.gallery = FaceGallery()
+        print(f">>> Galería de rostros: {len(self.gallery)} enrolados\n")
+
+    @property
+    def timings(self):
+        return dict(self.profiler.last)
+
+    def load_face_detector(self, backend):
+        try:
+            detector = create_face_detector(backend)
+        except Exception as e:
+            print(f">>> Backend '{backend}' no disponible ({e}), usando 'hog'.")
+            detector = create_face_detector("hog")
+        print(f">>> Detector de rostros: {detector.name}\n")
+        return detector
+
+    def detect_objects(self, image, mode='live', zones=None, frame_area=None):
+        """Ejecuta ambos detectores; devuelve (rostros, animales).
+
+        Con 'zones' [(x1, y1, x2, y2), ...] solo se analizan esos recortes;
+        'frame_area' (área del cuadro completo) mantiene MIN_AREA_PCT en
+        términos del cuadro y no del recorte.
+        """
+        if zones:
+            return self.detect_in_zones(image, mode, zones)
+
+        face_locations = []
+        detecciones = empty_detections()
+
+        # 1. PERSONAS
+        with self.profiler.stage('face_detection'):
+            try:
+                scale = 0.5 if mode == 'live' else 1.0
+                face_locations = self.face_detector.detect(image, scale)
+            except:
+                pass
+
+        # 2. ANIMALES (MobileNet)
+        if self.net and not self.model_failed:
+            try:
+                # MEJORA: Procesamiento multi-escala para mejor detección
+                escalas = (300, 400, 500) if mode == 'static' else (300,)
+                detecciones = detect_animals(self.net, image, escalas, self.profiler, frame_area)
+
+                if self.verbose:
+                    for det in detecciones:
+                        print(f"✅ Detectado: {CLASSES[det['class_id']]} con confianza {det['confidence']*100:.1f}% (área: {det['area']:.1f}%)")
+            except Exception as e:
+                print(f"Error en detección de animales: {e}")
+                self.model_failed = True
+
+        return face_locations, detecciones
+
+    def detect_in_zones(self, image, mode, zones):
+        """Detecta en cada zona y lleva las cajas a coordenadas del cuadro."""
+        h_img, w_img = image.shape[:2]
+        face_locations, parciales = [], []
+
+        for (x1, y1, x2, y2) in zones:
+            x1, x2 = max(0, int(x1)), min(w_img, int(x2))
+            y1, y2 = max(0, int(y1)), min(h_img, int(y2))
+            if x2 - x1 < 8 or y2 - y1 < 8:
+                continue
+            locs, dets = self.detect_objects(image[y1:y2, x1:x2], mode, frame_area=h_img * w_img)
+            face_locations += [(t + y1, r + x1, b + y1, l + x1) for (t, r, b, l) in locs]
+            parciales.append(offset_detections(dets, x1, y1))
+
+        detecciones = nms_per_class(np.concatenate(parciales)) if parciales else empty_detections()
+        return dedupe_face_locations(face_locations), detecciones
+
+    def identify_faces(self, image, face_locations):
+        """Nombre de cada rostro según la galería (UNKNOWN_LABEL si no está enrolado)."""
+        if not face_locations or len(self.gallery) == 0:
+            return [UNKNOWN_LABEL] * len(face_locations)
+        with self.profiler.stage('face_identification'):
+            try:
+                rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                encodings = face_recognition.face_encodings(rgb_image, face_locations)
+                return self.gallery.identify(encodings)
+            except Exception as e:
+                print(f"Error identificando rostros: {e}")
+                return [UNKNOWN_LABEL] * len(face_locations)
+
+    def draw_detections(self, image, face_locations, detecciones, face_names=None):
+        """Dibuja rostros y animales; devuelve los tipos detectados."""
+        detected_types = []
+        if face_names is None:
+            face_names = [UNKNOWN_LABEL] * len(face_locations)
+
+        if face_locations:
+            detected_types.append("PERSONA")
+            for (top, right, bottom, left), label in zip(face_locations, face_names):
+                cv2.rectangle(image, (left, top), (right, bottom), (0, 255, 0), 2)
+                (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_DUPLEX, 0.6, 1)
+                cv2.rectangle(image, (left, bottom - 25), (left + w + 10, bottom), (0, 255, 0), cv2.FILLED)
+                cv2.putText(image, label, (left + 5, bottom - 6), cv2.FONT_HERSHEY_DUPLEX, 0.6, (255, 255, 255), 1)
+
+        # Dibujar todas las detecciones
+        if len(detecciones):
+            detected_types.append("ANIMAL")
+
+            for det in detecciones:
+                startX, startY = int(det['startX']), int(det['startY'])
+                endX, endY = int(det['endX']), int(det['endY'])
+                cv2.rectangle(image, (startX, startY), (endX, endY), (255, 0, 255), 2)
+
+                # Solo mostrar "ANIMAL"
+                txt = "ANIMAL"
+                (w, h), _ = cv2.getTextSize(txt, cv2.FONT_HERSHEY_DUPLEX, 0.6, 1)
+                cv2.rectangle(image, (startX, startY - 25),
+                            (startX + w + 10, startY), (255, 0, 255), cv2.FILLED)
+                cv2.putText(image, txt, (startX + 5, startY - 6),
+                          cv2.FONT_HERSHEY_DUPLEX, 0.6, (255, 255, 255), 1)
+
+        return detected_types
+
+    def process_frame_for_objects(self, image, mode='live'):
+        """Detecta, identifica y dibuja sobre 'image'; devuelve (image, tipos, rostros, nombres, animales)."""
+        self.profiler.begin_frame()
+        face_locations, detecciones = self.detect_objects(image, mode)
+        face_names = self.identify_faces(image, face_locations)
+        with self.profiler.stage('drawing'):
+            detected_types = self.draw_detections(image, face_locations, detecciones, face_names)
+        return image, detected_types, face_locations, face_names, detecciones
@@ -0,0 +1,84 @@
+import cv2
+import numpy as np
+
+# Parámetros de flujo óptico (Lucas-Kanade piramidal)
+LK_PARAMS = dict(winSize=(15, 15), maxLevel=2,
+                 criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03))
+MAX_POINTS_PER_BOX = 30
+MAX_FB_ERROR = 1.5
+
+
+class OpticalFlowTracker:
+    """Sigue cajas (x1, y1, x2, y2) entre detecciones con flujo óptico disperso."""
+
+    def __init__(self, max_points=MAX_POINTS_PER_BOX, max_fb_error=MAX_FB_ERROR):
+        self.max_points = max_points
+        self.max_fb_error = max_fb_error
+        self.prev_gray = None
+        self.boxes = np.empty((0, 4), dtype=np.float32)
+        self.points = np.empty((0, 1, 2), dtype=np.float32)
+        self.owners = np.empty(0, dtype=np.int32)
+        self.initial_counts = np.empty(0, dtype=np.int32)
+
+    def init(self, gray, boxes):
+        """Reinicia el seguimiento con las cajas de la última detección."""
+        self.prev_gray = gray
+        self.boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        h, w = gray.shape[:2]
+
+        puntos, duenos = [], []
+        for i, (x1, y1, x2, y2) in enumerate(self.boxes.astype(np.int32)):
+            x1, y1 = max(0, x1), max(0, y1)
+            x2, y2 = min(w, x2), min(h, y2)
+            if x2 - x1 < 4 or y2 - y1 < 4:
+                continue
+            p = cv2.goodFeaturesToTrack(gray[y1:y2, x1:x2], self.max_points, 0.01, 3)
+            if p is None:
+                continue
+            p[:, 0, 0] += x1
+            p[:, 0, 1] += y1
+            puntos.append(p)
+            duenos.append(np.full(len(p), i, dtype=np.int32))
+
+        if puntos:
+            self.points = np.concatenate(puntos).astype(np.float32)
+            self.owners = np.concatenate(duenos)
+        else:
+            self.points = np.empty((0, 1, 2), dtype=np.float32)
+            self.owners = np.empty(0, dtype=np.int32)
+        self.initial_counts = np.bincount(self.owners, minlength=len(self.boxes))
+
+    @property
+    def trackable(self):
+        """Máscara de cajas con puntos de seguimiento; las demás quedan fijas hasta la próxima detección."""
+        return self.initial_counts > 0
+
+    def update(self, gray):
+        """Desplaza las cajas según el flujo; devuelve (cajas, confianza por caja)."""
+        n = len(self.boxes)
+        if n == 0 or len(self.points) == 0 or self.prev_gray is None:
+            self.prev_gray = gray
+            return self.boxes, np.zeros(n, dtype=np.float32)
+
+        # Un solo cálculo de flujo para todos los puntos de todas las cajas,
+        # con verificación ida y vuelta para descartar puntos inestables
+        nuevos, st, _ = cv2.calcOpticalFlowPyrLK(self.prev_gray, gray, self.points, None, **LK_PARAMS)
+        regreso, st_back, _ = cv2.calcOpticalFlowPyrLK(gray, self.prev_gray, nuevos, None, **LK_PARAMS)
+        fb_error = np.linalg.norm((self.points - regreso).reshape(-1, 2), axis=1)
+        good = (st.reshape(-1) == 1) & (st_back.reshape(-1) == 1) & (fb_error < self.max_fb_error)
+
+        desplazamiento = (nuevos - self.points).reshape(-1, 2)
+        for i in range(n):
+            sel = good & (self.owners == i)
+            if sel.any():
+                dx, dy = np.median(desplazamiento[sel], axis=0)
+                self.boxes[i] += (dx, dy, dx, dy)
+
+        self.points = nuevos[good]
+        self.owners = self.owners[good]
+        self.prev_gray = gray
+
+        vivos = np.bincount(self.owners, minlength=n)
+        confianza = vivos / np.maximum(self.initial_counts, 1)
+        confianza[self.initial_counts == 0] = 0.0
+        return self.boxes, confianza.astype(np.float32)
@@ -8,6 +8,9 @@ import os
 import time
 import queue
 
+from manos_adaptativo import TARGET_FPS
+from procesamiento_manos import DEFAULT_GESTURE, HandPipeline
+
 COLOR_BG = "#f5f7fa"
 COLOR_CARD = "#ffffff"
 COLOR_CARD_SECONDARY = "#e3f2fd"
@@ -30,7 +33,19 @@ FONT_SMALL = ("Segoe UI", 9)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 IMAGE_FOLDER = os.path.join(BASE_DIR, "data", "reference_images")
-DEFAULT_IMAGE_KEY = "NINGUNO"
+DEFAULT_IMAGE_KEY = DEFAULT_GESTURE
+
+# Canal de eventos (errores); el video va por LatestFrameSlot y el gesto por GestureStateSlot
+EVENT_QUEUE_SIZE = 16
+
+# MediaPipe Hands adaptativo (ver manos_adaptativo.py) para CPUs de bajo consumo
+ADAPTIVE_HANDS = True
+
+STATS_REFRESH_MS = 1000
+
+# Tamaño exacto de la vista previa; el hilo de video entrega cuadros RGB ya escalados
+PREVIEW_WIDTH = 620
+PREVIEW_HEIGHT = 465
 
 # Cargar Imágenes
 os.makedirs(IMAGE_FOLDER, exist_ok=True)
@@ -71,22 +86,118 @@ try:
 except Exception as e:
     print(f"Error cargando imágenes: {e}")
 
-class GestureController:
-    def __init__(self, app_queue):
+
+def reference_image_path(label):
+    """Imagen de referencia de un gesto aprendido: data/reference_images/<etiqueta>.jpg|png."""
+    if GESTURE_IMAGES.get(label):
+        return GESTURE_IMAGES[label]
+    for ext in (".jpg", ".jpeg", ".png"):
+        path = os.path.join(IMAGE_FOLDER, label.lower() + ext)
+        if os.path.exists(path):
+            return path
+    return GESTURE_IMAGES.get(DEFAULT_IMAGE_KEY)
+
+def fit_preview(frame):
+    """Recorta al aspecto de la vista previa, escala con INTER_LINEAR y pasa a RGB."""
+    h, w = frame.shape[:2]
+    target = PREVIEW_WIDTH / PREVIEW_HEIGHT
+    if w / h > target:
+        cw = int(round(h * target))
+        x0 = (w - cw) // 2
+        frame = frame[:, x0:x0 + cw]
+    elif w / h < target:
+        ch = int(round(w / target))
+        y0 = (h - ch) // 2
+        frame = frame[y0:y0 + ch]
+    frame = cv2.resize(frame, (PREVIEW_WIDTH, PREVIEW_HEIGHT), interpolation=cv2.INTER_LINEAR)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+class LatestFrameSlot:
+    """Guarda solo el cuadro más reciente; los que la UI no alcanza a mostrar se descartan."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.frame = None
+        self.published = 0
+        self.dropped = 0
+        self.rendered = 0
+
+    def put(self, frame):
+        with self.lock:
+            if self.frame is not None:
+                self.dropped += 1
+            self.frame = frame
+            self.published += 1
+
+    def take(self):
+        with self.lock:
+            frame, self.frame = self.frame, None
+            if frame is not None:
+                self.rendered += 1
+        return frame
+
+    def stats(self):
+        with self.lock:
+            return {"published": self.published, "rendered": self.rendered, "dropped": self.dropped}
+
+
+class GestureStateSlot:
+    """Último gesto y manos publicados. A diferencia de los cuadros, un cambio
+    nunca se pierde: la UI siempre lee el estado vigente."""
+
+    def __init__(self, gesture):
+        self.lock = threading.Lock()
+        self.gesture = gesture
+        self.hands = []
+        self.fresh = False
+
+    def put(self, gesture, hands):
+        with self.lock:
+            self.gesture, self.hands = gesture, hands
+            self.fresh = True
+
+    def take(self):
+        """(gesto, manos) si cambió desde la última lectura, si no None."""
+        with self.lock:
+            if not self.fresh:
+                return None
+            self.fresh = False
+            return self.gesture, self.hands
+
+
+class GestureController(HandPipeline):
+    """Cámara, dibujo y publicación de estado; el procesamiento de manos está en HandPipeline."""
+
+    def __init__(self, app_queue, frame_slot):
+        super().__init__(adaptive=ADAPTIVE_HANDS, default_label=DEFAULT_IMAGE_KEY)
         self.app_queue = app_queue
+        self.frame_slot = frame_slot
         self.cap = None
         self.running = False
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(min_detection_confidence=0.7, max_num_hands=1)
         self.mp_draw = mp.solutions.drawing_utils
-        self.last_gesture = DEFAULT_IMAGE_KEY
-        self.last_gesture_time = time.time()
-        self.debounce_time = 0.5
+        self.last_gesture = None
+        self.last_hands = None
+        self.state = GestureStateSlot(DEFAULT_IMAGE_KEY)
+
+    @property
+    def labels(self):
+        if self.classifier:
+            return self.classifier.labels + [DEFAULT_IMAGE_KEY]
+        return list(GESTURE_IMAGES)
+
+    def post_event(self, msg):
+        # Solo errores: si la UI está muy atrasada se descarta en lugar de acumularlo
+        try:
+            self.app_queue.put_nowait(msg)
+        except queue.Full:
+            pass
 
     def start(self):
         self.cap = cv2.VideoCapture(0)
         if not self.cap.isOpened():
-            self.app_queue.put(("error", "camera_error"))
+            self.post_event(("error", "camera_error"))
             return
         self.running = True
         self.thread = threading.Thread(target=self.detect_gestures_loop, daemon=True)
@@ -96,51 +207,47 @@ class GestureController:
         self.running = False
         if self.thread: self.thread.join(timeout=1.0)
         if self.cap: self.cap.release()
+        self.close()
         cv2.destroyAllWindows()
 
-    def classify_gesture(self, hand_landmarks):
-        try:
-            lm = hand_landmarks.landmark
-            h = self.mp_hands.HandLandmark
-            
-            thumb = lm[h.THUMB_TIP].x > lm[h.THUMB_IP].x
-            index = lm[h.INDEX_FINGER_TIP].y < lm[h.INDEX_FINGER_PIP].y
-            middle = lm[h.MIDDLE_FINGER_TIP].y < lm[h.MIDDLE_FINGER_PIP].y
-            ring = lm[h.RING_FINGER_TIP].y < lm[h.RING_FINGER_PIP].y
-            pinky = lm[h.PINKY_TIP].y < lm[h.PINKY_PIP].y
-            
-            if not index and not middle and not ring and not pinky: return "PUÑO"
-            if index and middle and ring and pinky: return "PALMA"
-            if index and not middle and not ring and not pinky: return "DEDO"
-            if index and middle and not ring and not pinky: return "TIJERA"
-            return DEFAULT_IMAGE_KEY
-        except:
-            return DEFAULT_IMAGE_KEY
-
     def detect_gestures_loop(self):
+        frame_budget = 1.0 / TARGET_FPS
+        hand_labels = []
+
         while self.running and self.cap.isOpened():
+            t0 = time.perf_counter()
             ret, frame = self.cap.read()
             if not ret: break
             
             frame = cv2.flip(frame, 1)
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(frame_rgb)
-            gesture = DEFAULT_IMAGE_KEY
+            results, fresh = self.process_hands(frame_rgb)
+
+            if fresh:
+                states, hand_labels = self.update_hands(results)
+                hands = tuple(states)
+                primary = states[0][2] if states else DEFAULT_IMAGE_KEY
+                if hands != self.last_hands or primary != self.last_gesture:
+                    self.last_hands = hands
+                    self.last_gesture = primary
+                    self.state.put(primary, states)
             
             if results.multi_hand_landmarks:
-                for hl in results.multi_hand_landmarks:
+                h, w = frame.shape[:2]
+                for hl, (tid, gesture) in zip(results.multi_hand_landmarks, hand_labels):
                     self.mp_draw.draw_landmarks(frame, hl, self.mp_hands.HAND_CONNECTIONS)
-                    gesture = self.classify_gesture(hl)
-            
-            if gesture != self.last_gesture:
-                self.last_gesture_time = time.time()
-                self.last_gesture = gesture
-            
-            if (time.time() - self.last_gesture_time > self.debounce_time):
-                self.app_queue.put(("gesture", gesture))
+                    wrist = hl.landmark[0]
+                    # Hershey no dibuja la Ñ
+                    cv2.putText(frame, f"{tid}: {gesture.replace('Ñ', 'N')}",
+                                (int(wrist.x * w) - 30, int(wrist.y * h) + 30),
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
 
-            self.app_queue.put(("video_frame", frame))
-            time.sleep(0.01)
+            self.frame_slot.put(fit_preview(frame))
+            if ADAPTIVE_HANDS:
+                # Ritmo objetivo en lugar de una pausa fija
+                time.sleep(max(0.0, frame_budget - (time.perf_counter() - t0)))
+            else:
+                time.sleep(0.01)
 
 class SignRecognitionApp(tk.Tk):
     def __init__(self):
@@ -154,9 +261,10 @@ class SignRecognitionApp(tk.Tk):
         self.config(bg=COLOR_BG)
         self.resizable(False, False)
 
-        self.current_gesture = DEFAULT_IMAGE_KEY
-        self.app_queue = queue.Queue()
-        self.gesture_control = GestureController(self.app_queue)
+        self.current_gesture = None  # el primer evento siempre actualiza la UI
+        self.app_queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self.frame_slot = LatestFrameSlot()
+        self.gesture_control = GestureController(self.app_queue, self.frame_slot)
 
         style = ttk.Style(self)
         style.theme_use("clam")
@@ -179,8 +287,10 @@ class SignRecognitionApp(tk.Tk):
         ttk.Label(cam_wrap, text="📹 Cámara en Vivo", style="Subtitle.TLabel").pack(anchor="w", pady=(0, 10))
         
         # El contenedor se crea y empaqueta correctamente ahora
-        self.camera_container = self._create_card_with_shadow(cam_wrap, width=620, height=465)
+        self.camera_container = self._create_card_with_shadow(cam_wrap, width=PREVIEW_WIDTH, height=PREVIEW_HEIGHT)
         
+        # Una sola PhotoImage persistente; cada cuadro se copia con paste()
+        self.photo = ImageTk.PhotoImage("RGB", (PREVIEW_WIDTH, PREVIEW_HEIGHT))
         self.video_label = tk.Label(self.camera_container, text="Iniciando...", bg=COLOR_CARD, fg=COLOR_FG)
         self.video_label.pack(expand=True, fill=tk.BOTH)
 
@@ -193,12 +303,20 @@ class SignRecognitionApp(tk.Tk):
         res_inner = tk.Frame(self.result_container, bg=COLOR_CARD)
         res_inner.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
-        self.img_result = self.load_img(GESTURE_IMAGES[DEFAULT_IMAGE_KEY])
+        # Todas las imágenes de referencia se decodifican y ajustan una sola vez
+        self.gesture_photos = {key: self.load_img(reference_image_path(key))
+                               for key in set(GESTURE_IMAGES) | set(self.gesture_control.labels)}
+        self.missing_photo = self.load_img(None)
+        self.img_result = self.gesture_photos.get(DEFAULT_IMAGE_KEY, self.missing_photo)
         self.lbl_img = tk.Label(res_inner, image=self.img_result, bg=COLOR_CARD)
         self.lbl_img.pack(pady=20)
         
         self.lbl_text = tk.Label(res_inner, text=DEFAULT_IMAGE_KEY, font=FONT_BIG_STATUS, bg=COLOR_CARD, fg=COLOR_SUCCESS)
         self.lbl_text.pack(pady=10)
+
+        # Una línea por mano seguida: "1 · Derecha: PUÑO"
+        self.lbl_hands = tk.Label(res_inner, text="", font=FONT_BODY, bg=COLOR_CARD, fg=COLOR_FG, justify=tk.LEFT)
+        self.lbl_hands.pack(pady=5)
         
         self.status_ind = tk.Frame(res_inner, bg=COLOR_WARNING, height=5)
         self.status_ind.pack(fill=tk.X, side=tk.BOTTOM, pady=10)
@@ -207,9 +325,13 @@ class SignRecognitionApp(tk.Tk):
         self.lbl_status = tk.Label(self, text="Estado: Iniciando...", font=FONT_STATUS, bg=COLOR_CARD_SECONDARY, fg=COLOR_FG, height=2)
         self.lbl_status.pack(fill=tk.X, side=tk.BOTTOM)
 
+        self.lbl_stats = tk.Label(self.lbl_status, text="", font=FONT_SMALL, bg=COLOR_CARD_SECONDARY, fg=COLOR_FG)
+        self.lbl_stats.place(relx=1.0, rely=0.5, anchor="e", x=-15)
+
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.gesture_control.start()
         self.process_queue()
+        self.update_stats()
 
     def _create_card_with_shadow(self, parent, width, height):
         # 1. Crear sombra y EMPAQUETARLA 
@@ -235,23 +357,43 @@ class SignRecognitionApp(tk.Tk):
             return ImageTk.PhotoImage(Image.new('RGB', (220, 220), color=COLOR_ERROR))
 
     def process_queue(self):
+        frame = self.frame_slot.take()
+        if frame is not None:
+            self.photo.paste(Image.fromarray(frame))
+            if not self.video_label.cget("image"):
+                self.video_label.config(image=self.photo)
+
+        state = self.gesture_control.state.take()
+        if state is not None:
+            gesture, hands = state
+            self.update_ui(gesture)
+            self.update_hands(hands)
+
         try:
             while True:
                 type, data = self.app_queue.get_nowait()
-                if type == "video_frame":
-                    img = Image.fromarray(cv2.cvtColor(data, cv2.COLOR_BGR2RGB))
-                    img = ImageOps.fit(img, (620, 465), Image.Resampling.LANCZOS)
-                    self.imgtk = ImageTk.PhotoImage(img)
-                    self.video_label.config(image=self.imgtk)
-                elif type == "gesture":
-                    self.update_ui(data)
-                elif type == "error":
+                if type == "error":
                     self.lbl_status.config(text=f"Error: {data}", fg=COLOR_ERROR)
         except queue.Empty:
             pass
         self.after(15, self.process_queue)
 
+    def update_stats(self):
+        s = self.frame_slot.stats()
+        self.lbl_stats.config(text=f"{self.gesture_control.hands_description} · "
+                                   f"Cuadros: {s['rendered']} mostrados · {s['dropped']} descartados")
+        self.after(STATS_REFRESH_MS, self.update_stats)
+
+    def update_hands(self, states):
+        lines = [f"{tid} · {handedness}: {gesture}" for tid, handedness, gesture in states]
+        self.lbl_hands.config(text="\n".join(lines) if lines else "Sin manos")
+
     def update_ui(self, gesture):
+        # El estado puede cambiar solo en las manos: la imagen se redibuja si cambió el gesto
+        if gesture == self.current_gesture:
+            return
+        self.current_gesture = gesture
+
         if gesture == DEFAULT_IMAGE_KEY:
             self.lbl_status.config(text="Esperando gesto...", fg=COLOR_FG)
             self.status_ind.config(bg=COLOR_WARNING)
@@ -260,7 +402,7 @@ class SignRecognitionApp(tk.Tk):
             self.status_ind.config(bg=COLOR_SUCCESS)
             
         self.lbl_text.config(text=gesture)
-        self.img_result = self.load_img(GESTURE_IMAGES.get(gesture))
+        self.img_result = self.gesture_photos.get(gesture, self.missing_photo)
         self.lbl_img.config(image=self.img_result)
 
     def on_close(self):
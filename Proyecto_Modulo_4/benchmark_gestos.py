@@ -0,0 +1,171 @@
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from extraer_landmarks import HANDEDNESS_IDS
+from manos_adaptativo import TARGET_FPS
+from procesamiento_manos import DEFAULT_GESTURE, HANDEDNESS_ES, HandPipeline
+
+VIDEO_STAGES = ("flip", "cvtColor", "hands", "classify", "smooth")
+LANDMARK_STAGES = ("classify", "smooth")
+HANDEDNESS_NAMES = {v: HANDEDNESS_ES[k] for k, v in HANDEDNESS_IDS.items()}
+
+
+def summarize(values):
+    v = np.asarray(values, dtype=np.float64)
+    if not len(v):
+        return {"n": 0, "media_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    return {
+        "n": int(len(v)),
+        "media_ms": float(v.mean()),
+        "p50_ms": float(np.percentile(v, 50)),
+        "p95_ms": float(np.percentile(v, 95)),
+        "max_ms": float(v.max()),
+    }
+
+
+def video_frames(path, controller, timings):
+    """Reproduce un video con los mismos pasos que detect_gestures_loop."""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise IOError(f"no se pudo abrir '{path}'")
+    fps = cap.get(cv2.CAP_PROP_FPS) or TARGET_FPS
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            t0 = time.perf_counter()
+            frame = cv2.flip(frame, 1)
+            t1 = time.perf_counter()
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            t2 = time.perf_counter()
+            results, fresh = controller.process_hands(frame_rgb)
+            t3 = time.perf_counter()
+            timings["flip"].append((t1 - t0) * 1000)
+            timings["cvtColor"].append((t2 - t1) * 1000)
+            if fresh:
+                timings["hands"].append((t3 - t2) * 1000)
+            yield t0, fps, fresh, controller.read_hands(results) if fresh else None
+    finally:
+        cap.release()
+
+
+def landmark_frames(path):
+    """Reproduce un .npz de extraer_landmarks.py (sin decodificar video ni correr Hands)."""
+    data = np.load(path)
+    fps = float(data["fps"]) or TARGET_FPS
+    frames, landmarks, handedness = data["frames"], data["landmarks"], data["handedness"]
+    starts = np.searchsorted(frames, np.arange(int(data["n_frames"]) + 1))
+    for f in range(int(data["n_frames"])):
+        a, b = starts[f], starts[f + 1]
+        names = [HANDEDNESS_NAMES.get(int(h), "?") for h in handedness[a:b]]
+        yield time.perf_counter(), fps, True, (landmarks[a:b], names)
+
+
+def run(source, controller):
+    is_video = not source.lower().endswith(".npz")
+    timings = {stage: [] for stage in (VIDEO_STAGES if is_video else LANDMARK_STAGES)}
+    frame_ms, events, raw = [], [], []
+    fps = TARGET_FPS
+    n_frames = 0
+    last_gesture = None
+    frames = video_frames(source, controller, timings) if is_video else landmark_frames(source)
+
+    start = time.perf_counter()
+    for t0, fps, fresh, hands in frames:
+        if fresh:
+            points, handedness = hands
+            t1 = time.perf_counter()
+            labels, confidences = controller.classify_hands(points) if len(points) else ([], [])
+            t2 = time.perf_counter()
+            states, _ = controller.track_hands(points, handedness, labels, confidences)
+            t3 = time.perf_counter()
+            timings["classify"].append((t2 - t1) * 1000)
+            timings["smooth"].append((t3 - t2) * 1000)
+
+            # Predicción cruda de la mano principal, para ubicar el inicio de cada gesto
+            primary_raw = DEFAULT_GESTURE
+            if states:
+                assigned = controller.hand_tracker.last_assigned
+                if states[0][0] in assigned:
+                    primary_raw = labels[assigned.index(states[0][0])]
+            raw.append(primary_raw)
+
+            primary = states[0][2] if states else DEFAULT_GESTURE
+            if primary != last_gesture:
+                if last_gesture is not None:
+                    events.append((n_frames, primary, (time.perf_counter() - t0) * 1000))
+                last_gesture = primary
+        else:
+            raw.append(raw[-1] if raw else DEFAULT_GESTURE)
+        frame_ms.append((time.perf_counter() - t0) * 1000)
+        n_frames += 1
+    wall = time.perf_counter() - start
+
+    # Inicio del gesto: primer cuadro de la racha de predicciones crudas que terminó en el evento.
+    # Latencia = cuadros de espera del suavizado al ritmo del video + procesamiento del cuadro del evento.
+    onset = []
+    event_list = []
+    for frame, label, processing_ms in events:
+        first = frame
+        while first > 0 and raw[first - 1] == label:
+            first -= 1
+        latency = (frame - first) * 1000.0 / fps + processing_ms
+        onset.append(latency)
+        event_list.append({"cuadro": frame, "gesto": label, "inicio": first,
+                           "latencia_ms": round(latency, 2)})
+
+    return {
+        "fuente": source,
+        "modo": "video" if is_video else "landmarks",
+        "clasificador": "knn" if controller.classifier else "reglas",
+        "hands": controller.hands_description if is_video else None,
+        "cuadros": n_frames,
+        "procesados": len(timings["classify"]),
+        "tiempo_s": round(wall, 3),
+        "cuadros_por_s": n_frames / wall if wall > 0 else 0.0,
+        "fps_fuente": fps,
+        "cuadro": summarize(frame_ms),
+        "etapas": {stage: summarize(v) for stage, v in timings.items()},
+        "inicio_a_evento": summarize(onset),
+        "eventos": event_list,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide latencia y rendimiento del reconocimiento de gestos.")
+    parser.add_argument("fuente", help="Video grabado o .npz de extraer_landmarks.py")
+    parser.add_argument("--json", help="Guardar el reporte en este archivo (por defecto se imprime)")
+    parser.add_argument("--sin-adaptativo", action="store_true",
+                        help="Hands fijo en lugar de AdaptiveHands (resultados más repetibles)")
+    args = parser.parse_args()
+
+    controller = HandPipeline(adaptive=not args.sin_adaptativo)
+    try:
+        report = run(args.fuente, controller)
+    finally:
+        controller.close()
+
+    print(f"{'ETAPA':<10} {'MEDIA ms':>9} {'P50 ms':>8} {'P95 ms':>8}")
+    print("-" * 38)
+    for stage, s in list(report["etapas"].items()) + [("cuadro", report["cuadro"]),
+                                                      ("evento", report["inicio_a_evento"])]:
+        print(f"{stage:<10} {s['media_ms']:>9.2f} {s['p50_ms']:>8.2f} {s['p95_ms']:>8.2f}")
+    print(f"{report['cuadros']} cuadros · {report['cuadros_por_s']:.1f} cuadros/s · "
+          f"{len(report['eventos'])} eventos")
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"Reporte guardado en '{args.json}'")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import glob
+import os
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASET_DIR = os.path.join(BASE_DIR, "data", "gestos")
+MODEL_PATH = os.path.join(BASE_DIR, "models", "clasificador_gestos.npz")
+
+NUM_LANDMARKS = 21
+FEATURE_SIZE = NUM_LANDMARKS * 3
+MIDDLE_MCP = 9
+
+
+def landmarks_to_array(hand_landmarks):
+    """Convierte los landmarks de MediaPipe en un arreglo (21, 3)."""
+    return np.array([(p.x, p.y, p.z) for p in hand_landmarks.landmark], dtype=np.float32)
+
+
+def normalize_landmarks(points):
+    """Normaliza una o varias manos (N, 21, 3) a vectores (N, 63).
+
+    Origen en la muñeca, rotación para que muñeca -> nudillo medio apunte
+    hacia arriba y escala por la distancia máxima a la muñeca. Así el vector
+    no depende de la posición, el tamaño ni el giro de la mano en la imagen.
+    """
+    pts = np.array(points, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    pts -= pts[:, :1]
+
+    v = pts[:, MIDDLE_MCP, :2]
+    theta = np.arctan2(v[:, 0], -v[:, 1])
+    c, s = np.cos(theta)[:, None], np.sin(theta)[:, None]
+    x, y = pts[:, :, 0].copy(), pts[:, :, 1].copy()
+    pts[:, :, 0] = c * x + s * y
+    pts[:, :, 1] = -s * x + c * y
+
+    scale = np.linalg.norm(pts[:, :, :2], axis=2).max(axis=1)
+    pts /= np.maximum(scale, 1e-6)[:, None, None]
+    return pts.reshape(-1, FEATURE_SIZE)
+
+
+def append_samples(label, vectors, dataset_dir=DATASET_DIR):
+    """Agrega vectores normalizados al archivo data/gestos/<ETIQUETA>.npy."""
+    os.makedirs(dataset_dir, exist_ok=True)
+    path = os.path.join(dataset_dir, f"{label}.npy")
+    vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, FEATURE_SIZE)
+    if os.path.exists(path):
+        vectors = np.vstack([np.load(path), vectors])
+    np.save(path, vectors)
+    return len(vectors)
+
+
+def load_dataset(dataset_dir=DATASET_DIR):
+    """Devuelve (X, y, etiquetas) con todas las muestras grabadas."""
+    labels, xs, ys = [], [], []
+    for path in sorted(glob.glob(os.path.join(dataset_dir, "*.npy"))):
+        data = np.load(path).astype(np.float32).reshape(-1, FEATURE_SIZE)
+        if len(data) == 0:
+            continue
+        ys.append(np.full(len(data), len(labels), dtype=np.int32))
+        labels.append(os.path.splitext(os.path.basename(path))[0])
+        xs.append(data)
+    if not xs:
+        return np.empty((0, FEATURE_SIZE), np.float32), np.empty(0, np.int32), []
+    return np.vstack(xs), np.concatenate(ys), labels
+
+
+class KnnGestureClassifier:
+    """k vecinos más cercanos en NumPy sobre vectores normalizados.
+
+    predict() clasifica todas las manos de un cuadro en una sola operación
+    y devuelve (etiquetas, confianza = fracción de votos). Si el vecino más
+    cercano está más lejos que 'reject_distance', la mano se marca con
+    'unknown_label'.
+    """
+
+    def __init__(self, k=5, reject_distance=None, unknown_label="NINGUNO"):
+        self.k = k
+        self.reject_distance = reject_distance
+        self.unknown_label = unknown_label
+        self.X = np.empty((0, FEATURE_SIZE), np.float32)
+        self.y = np.empty(0, np.int32)
+        self.labels = []
+        self._sq_norms = np.empty(0, np.float32)
+
+    def fit(self, X, y, labels):
+        self.X = np.asarray(X, dtype=np.float32)
+        self.y = np.asarray(y, dtype=np.int32)
+        self.labels = list(labels)
+        self._sq_norms = np.einsum("ij,ij->i", self.X, self.X)
+        return self
+
+    def _distances(self, Q):
+        q_sq = np.einsum("ij,ij->i", Q, Q)
+        return np.maximum(q_sq[:, None] + self._sq_norms[None, :] - 2.0 * (Q @ self.X.T), 0.0)
+
+    def predict(self, vectors):
+        Q = np.asarray(vectors, dtype=np.float32).reshape(-1, FEATURE_SIZE)
+        if len(Q) == 0 or len(self.X) == 0:
+            return [self.unknown_label] * len(Q), np.zeros(len(Q), np.float32)
+
+        k = min(self.k, len(self.X))
+        d2 = self._distances(Q)
+        nn = np.argpartition(d2, k - 1, axis=1)[:, :k]
+
+        votes = np.zeros((len(Q), len(self.labels)), dtype=np.float32)
+        np.add.at(votes, (np.repeat(np.arange(len(Q)), k), self.y[nn].ravel()), 1.0)
+        best = votes.argmax(axis=1)
+        confidence = votes[np.arange(len(Q)), best] / k
+
+        out = [self.labels[i] for i in best.tolist()]
+        if self.reject_distance is not None:
+            nearest = np.sqrt(d2[np.arange(len(Q))[:, None], nn].min(axis=1))
+            for i in np.flatnonzero(nearest > self.reject_distance):
+                out[i] = self.unknown_label
+                confidence[i] = 0.0
+        return out, confidence
+
+    def save(self, path=MODEL_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path, X=self.X, y=self.y, labels=np.array(self.labels, dtype=str),
+                 k=self.k, reject_distance=-1.0 if self.reject_distance is None else self.reject_distance)
+
+    @classmethod
+    def load(cls, path=MODEL_PATH, unknown_label="NINGUNO"):
+        data = np.load(path, allow_pickle=False)
+        reject = float(data["reject_distance"])
+        model = cls(k=int(data["k"]), reject_distance=None if reject < 0 else reject,
+                    unknown_label=unknown_label)
+        return model.fit(data["X"], data["y"], data["labels"].tolist())
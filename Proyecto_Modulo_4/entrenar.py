@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+
+from clasificador_gestos import DATASET_DIR, MODEL_PATH, KnnGestureClassifier, load_dataset
+
+K_VECINOS = 5
+TEST_SIZE = 0.2
+# Margen sobre la distancia típica entre muestras para rechazar poses desconocidas
+REJECT_MARGIN = 1.5
+
+
+def entrenar_clasificador(k=K_VECINOS, test_size=TEST_SIZE, seed=42):
+    """
+    Entrena el clasificador kNN con las muestras de data/gestos/*.npy
+    """
+    print("Iniciando el proceso de entrenamiento...")
+    X, y, labels = load_dataset()
+    if len(labels) < 2:
+        print(f"Error: se necesitan al menos 2 gestos grabados en '{DATASET_DIR}'.")
+        print("Graba muestras con: python grabar_gestos.py ETIQUETA")
+        return
+
+    for i, label in enumerate(labels):
+        print(f"   {label}: {int((y == i).sum())} muestras")
+
+    # División entrenamiento / prueba
+    rng = np.random.default_rng(seed)
+    idx = rng.permutation(len(X))
+    n_test = int(len(X) * test_size)
+    test, train = idx[:n_test], idx[n_test:]
+
+    model = KnnGestureClassifier(k=k).fit(X[train], y[train], labels)
+    if n_test:
+        pred, _ = model.predict(X[test])
+        accuracy = np.mean(np.array(pred) == np.array(labels)[y[test]])
+        print(f"Precisión (Accuracy) en datos de prueba: {accuracy:.4f}")
+
+    # Distancia al vecino más cercano (sin contarse a sí mismo) para el umbral de rechazo
+    model.fit(X, y, labels)
+    nn_dist = np.empty(len(X), dtype=np.float32)
+    for start in range(0, len(X), 1024):
+        d2 = model._distances(X[start:start + 1024])
+        rows = np.arange(len(d2))
+        d2[rows, start + rows] = np.inf
+        nn_dist[start:start + 1024] = np.sqrt(d2.min(axis=1))
+    model.reject_distance = float(np.percentile(nn_dist, 99) * REJECT_MARGIN)
+    print(f"Distancia de rechazo: {model.reject_distance:.4f}")
+
+    # Latencia de inferencia para una mano
+    sample = X[:1]
+    model.predict(sample)
+    t0 = time.perf_counter()
+    for _ in range(200):
+        model.predict(sample)
+    print(f"Inferencia: {(time.perf_counter() - t0) / 200 * 1000:.3f} ms por cuadro")
+
+    model.save()
+    print(f"¡Modelo guardado en '{MODEL_PATH}'!")
+
+
+if __name__ == "__main__":
+    entrenar_clasificador()
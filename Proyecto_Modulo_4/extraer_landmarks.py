@@ -0,0 +1,127 @@
+import argparse
+import glob
+import os
+import time
+from multiprocessing import Pool
+
+import cv2
+import numpy as np
+
+from clasificador_gestos import BASE_DIR, landmarks_to_array
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+HANDEDNESS_IDS = {"Left": 0, "Right": 1}
+
+# Configuración de Hands por proceso
+_hands_options = None
+_mirror = False
+
+
+def _init_worker(max_hands, min_confidence, mirror):
+    global _hands_options, _mirror
+    cv2.setNumThreads(1)
+    _hands_options = dict(static_image_mode=False, max_num_hands=max_hands,
+                          min_detection_confidence=min_confidence)
+    _mirror = mirror
+
+
+def output_path(video, videos_dir, out_dir):
+    """Replica bajo out_dir la ruta del video relativa a videos_dir (ok/clip1.mp4 -> ok/clip1.npz)."""
+    rel = os.path.relpath(video, videos_dir)
+    return os.path.join(out_dir, os.path.splitext(rel)[0] + ".npz")
+
+
+def _extract(task):
+    """Procesa un video y guarda sus landmarks en un .npz."""
+    import mediapipe as mp
+    video, out_path = task
+    cap = cv2.VideoCapture(video)
+    if not cap.isOpened():
+        return video, 0, 0, 0.0, "no se pudo abrir"
+    # Hands nuevo por video: el modo seguimiento no arrastra manos del video anterior
+    hands = mp.solutions.hands.Hands(**_hands_options)
+
+    frames, hand_index, handedness, landmarks = [], [], [], []
+    n_frames = 0
+    t0 = time.perf_counter()
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        if _mirror:
+            frame = cv2.flip(frame, 1)
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        if results.multi_hand_landmarks:
+            labels = [h.classification[0].label for h in (results.multi_handedness or [])]
+            for i, hl in enumerate(results.multi_hand_landmarks):
+                frames.append(n_frames)
+                hand_index.append(i)
+                handedness.append(HANDEDNESS_IDS.get(labels[i], -1) if i < len(labels) else -1)
+                landmarks.append(landmarks_to_array(hl))
+        n_frames += 1
+    elapsed = time.perf_counter() - t0
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+    cap.release()
+    hands.close()
+
+    # Se escribe a un temporal y se renombra: un .npz existente siempre está completo
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = out_path + ".tmp.npz"
+    np.savez_compressed(
+        tmp_path,
+        frames=np.array(frames, dtype=np.int32),
+        hand_index=np.array(hand_index, dtype=np.int8),
+        handedness=np.array(handedness, dtype=np.int8),
+        landmarks=np.array(landmarks, dtype=np.float32).reshape(-1, 21, 3),
+        n_frames=n_frames,
+        fps=fps,
+    )
+    os.replace(tmp_path, out_path)
+    return video, n_frames, len(frames), elapsed, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extrae landmarks de manos de una carpeta de videos.")
+    parser.add_argument("videos", help="Carpeta con videos (se busca recursivamente)")
+    parser.add_argument("--salida", default=os.path.join(BASE_DIR, "data", "landmarks"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--manos", type=int, default=2, help="max_num_hands")
+    parser.add_argument("--confianza", type=float, default=0.7)
+    parser.add_argument("--espejar", action="store_true", help="Voltear como la cámara de la app")
+    parser.add_argument("--forzar", action="store_true", help="Reprocesar videos ya extraídos")
+    args = parser.parse_args()
+
+    videos = sorted(p for p in glob.glob(os.path.join(args.videos, "**", "*"), recursive=True)
+                    if p.lower().endswith(VIDEO_EXTENSIONS))
+    os.makedirs(args.salida, exist_ok=True)
+    tasks = [(v, output_path(v, args.videos, args.salida)) for v in videos]
+    pending = [t for t in tasks if args.forzar or not os.path.exists(t[1])]
+
+    print(f"Videos: {len(videos)} · ya extraídos: {len(tasks) - len(pending)} · pendientes: {len(pending)}")
+    if not pending:
+        return
+
+    total_frames = total_hands = 0
+    t0 = time.perf_counter()
+    with Pool(args.workers, initializer=_init_worker,
+              initargs=(args.manos, args.confianza, args.espejar)) as pool:
+        for video, n_frames, n_hands, elapsed, error in pool.imap_unordered(_extract, pending):
+            if error:
+                print(f"  ERROR {video}: {error}")
+                continue
+            total_frames += n_frames
+            total_hands += n_hands
+            rate = n_frames / elapsed if elapsed > 0 else 0.0
+            print(f"  {os.path.relpath(video, args.videos)}: {n_frames} cuadros, {n_hands} manos, {rate:.1f} cuadros/s")
+    wall = time.perf_counter() - t0
+
+    print("=" * 50)
+    print(f" Cuadros: {total_frames} · manos: {total_hands} · tiempo: {wall:.1f} s")
+    print(f" Rendimiento total: {total_frames / wall if wall > 0 else 0:.1f} cuadros/s "
+          f"con {args.workers} proceso(s)")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
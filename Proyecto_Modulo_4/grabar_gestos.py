@@ -0,0 +1,70 @@
+import argparse
+
+import cv2
+import mediapipe as mp
+
+from clasificador_gestos import DATASET_DIR, append_samples, landmarks_to_array, normalize_landmarks
+
+
+def grabar(label, muestras, camara=0):
+    """
+    Graba vectores normalizados de 21 landmarks para una etiqueta.
+    ESPACIO inicia/pausa la grabación, Q o ESC termina y guarda.
+    """
+    cap = cv2.VideoCapture(camara)
+    if not cap.isOpened():
+        print("Error: no se pudo abrir la cámara.")
+        return
+
+    mp_hands = mp.solutions.hands
+    mp_draw = mp.solutions.drawing_utils
+    hands = mp_hands.Hands(min_detection_confidence=0.7, max_num_hands=1)
+
+    vectores = []
+    grabando = False
+    print(f"Etiqueta '{label}': ESPACIO para grabar/pausar, Q para terminar.")
+
+    while len(vectores) < muestras:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        # Igual que la app: imagen espejada
+        frame = cv2.flip(frame, 1)
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        if results.multi_hand_landmarks:
+            hl = results.multi_hand_landmarks[0]
+            mp_draw.draw_landmarks(frame, hl, mp_hands.HAND_CONNECTIONS)
+            if grabando:
+                vectores.append(normalize_landmarks(landmarks_to_array(hl))[0])
+
+        estado = "GRABANDO" if grabando else "PAUSA"
+        color = (0, 0, 255) if grabando else (200, 200, 200)
+        cv2.putText(frame, f"{label} - {estado} {len(vectores)}/{muestras}", (10, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2, cv2.LINE_AA)
+        cv2.imshow("Grabar gestos", frame)
+
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord(' '):
+            grabando = not grabando
+        elif key in (ord('q'), 27):
+            break
+
+    cap.release()
+    cv2.destroyAllWindows()
+    hands.close()
+
+    if vectores:
+        total = append_samples(label, vectores)
+        print(f"Guardadas {len(vectores)} muestras. Total '{label}': {total} en '{DATASET_DIR}'")
+    else:
+        print("No se grabaron muestras.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Graba landmarks de un gesto para entrenar el clasificador.")
+    parser.add_argument("etiqueta", help="Nombre del gesto, p. ej. PUÑO o OK")
+    parser.add_argument("--muestras", type=int, default=300)
+    parser.add_argument("--camara", type=int, default=0)
+    args = parser.parse_args()
+    grabar(args.etiqueta.upper(), args.muestras, args.camara)
@@ -0,0 +1,133 @@
+import math
+import time
+
+import cv2
+import mediapipe as mp
+
+TARGET_FPS = 20
+# Perfiles de más caro a más barato: (model_complexity, ancho de entrada)
+PROFILES = [(1, 640), (0, 640), (0, 480), (0, 320)]
+# Sin manos durante este tiempo se pasa al modo reposo
+IDLE_SECONDS = 2.0
+IDLE_PROFILE = (0, 256)
+IDLE_SKIP = 3
+# Cuadros entre cambios de perfil (evita oscilar)
+COOLDOWN_FRAMES = 15
+EMA_ALPHA = 0.1
+# Con saltos grandes entre cuadros procesados el seguimiento pierde la mano:
+# a partir de este salto se usa static_image_mode
+STATIC_SKIP = 3
+
+
+class AdaptiveHands:
+    """MediaPipe Hands que ajusta su costo a la latencia medida.
+
+    Baja la complejidad del modelo y la resolución de entrada cuando el
+    tiempo por cuadro supera el presupuesto de TARGET_FPS, las sube cuando
+    sobra tiempo, salta cuadros si ni el perfil más barato alcanza y entra
+    en modo reposo cuando no hay manos. process() devuelve (results, fresh);
+    en cuadros saltados 'results' es el último resultado.
+    """
+
+    def __init__(self, target_fps=TARGET_FPS, max_num_hands=1, min_detection_confidence=0.7):
+        self.budget_ms = 1000.0 / target_fps
+        self.max_num_hands = max_num_hands
+        self.min_detection_confidence = min_detection_confidence
+
+        self.level = 0
+        self.skip = 1
+        self.static = False
+        self.idle = False
+        self.ema_ms = None
+        self.frame_index = 0
+        self.cooldown = 0
+        self.last_hand_time = time.time()
+        self.last_results = None
+
+        self.hands = None
+        self._hands_key = None
+        self._build()
+
+    @property
+    def profile(self):
+        return IDLE_PROFILE if self.idle else PROFILES[self.level]
+
+    def _build(self):
+        complexity, _ = self.profile
+        key = (complexity, self.static)
+        if key == self._hands_key:
+            return
+        if self.hands is not None:
+            self.hands.close()
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=self.static,
+            model_complexity=complexity,
+            max_num_hands=self.max_num_hands,
+            min_detection_confidence=self.min_detection_confidence)
+        self._hands_key = key
+
+    def process(self, frame_rgb):
+        self.frame_index += 1
+        skip = IDLE_SKIP if self.idle else self.skip
+        if self.last_results is not None and self.frame_index % skip != 0:
+            return self.last_results, False
+
+        _, width = self.profile
+        h, w = frame_rgb.shape[:2]
+        if w > width:
+            frame_rgb = cv2.resize(frame_rgb, (width, int(h * width / w)), interpolation=cv2.INTER_AREA)
+
+        t0 = time.perf_counter()
+        results = self.hands.process(frame_rgb)
+        ms = (time.perf_counter() - t0) * 1000
+
+        now = time.time()
+        if results.multi_hand_landmarks:
+            self.last_hand_time = now
+        self._adapt(ms, now)
+        self.last_results = results
+        return results, True
+
+    def _adapt(self, ms, now):
+        # Modo reposo: entra sin manos, sale apenas aparece una
+        idle = now - self.last_hand_time > IDLE_SECONDS
+        if idle != self.idle:
+            self.idle = idle
+            self.ema_ms = None
+            self.cooldown = COOLDOWN_FRAMES
+            self._build()
+            return
+
+        self.ema_ms = ms if self.ema_ms is None else (1 - EMA_ALPHA) * self.ema_ms + EMA_ALPHA * ms
+        if self.idle or self.cooldown > 0:
+            self.cooldown -= 1
+            return
+
+        if self.ema_ms > self.budget_ms * 0.9:
+            if self.level < len(PROFILES) - 1:
+                self.level += 1
+            else:
+                self.skip = min(8, max(self.skip + 1, math.ceil(self.ema_ms / self.budget_ms)))
+        elif self.ema_ms < self.budget_ms * 0.5:
+            if self.skip > 1:
+                self.skip -= 1
+            elif self.level > 0:
+                self.level -= 1
+        else:
+            return
+
+        self.static = self.skip >= STATIC_SKIP
+        self.ema_ms = None
+        self.cooldown = COOLDOWN_FRAMES
+        self._build()
+
+    def describe(self):
+        complexity, width = self.profile
+        mode = "reposo" if self.idle else ("estático" if self.static else "seguimiento")
+        skip = IDLE_SKIP if self.idle else self.skip
+        ema = f"{self.ema_ms:.0f} ms" if self.ema_ms is not None else "--"
+        return f"Hands c{complexity} {width}px 1/{skip} {mode} ({ema})"
+
+    def close(self):
+        if self.hands is not None:
+            self.hands.close()
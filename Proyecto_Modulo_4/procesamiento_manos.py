@@ -0,0 +1,112 @@
+import os
+
+import mediapipe as mp
+import numpy as np
+
+from manos_adaptativo import TARGET_FPS, AdaptiveHands
+from seguimiento_manos import HandTracker
+from clasificador_gestos import MODEL_PATH, KnnGestureClassifier, landmarks_to_array, normalize_landmarks
+
+DEFAULT_GESTURE = "NINGUNO"
+
+# Manos seguidas a la vez, cada una con su identidad y su gesto
+MAX_HANDS = 2
+HANDEDNESS_ES = {"Left": "Izquierda", "Right": "Derecha"}
+
+# Índices de landmarks: puntas y articulaciones PIP de índice, medio, anular y meñique
+FINGER_TIPS = [8, 12, 16, 20]
+FINGER_PIPS = [6, 10, 14, 18]
+
+
+class HandPipeline:
+    """Hands, clasificación y seguimiento de manos, sin interfaz.
+
+    Lo usan el controlador de la app (app.py) y el benchmark
+    (benchmark_gestos.py): importar este módulo no abre ventanas ni toca
+    las imágenes de referencia.
+    """
+
+    def __init__(self, adaptive=True, default_label=DEFAULT_GESTURE):
+        self.adaptive = adaptive
+        self.default_label = default_label
+        if adaptive:
+            self.hands = AdaptiveHands(target_fps=TARGET_FPS, max_num_hands=MAX_HANDS, min_detection_confidence=0.7)
+        else:
+            self.hands = mp.solutions.hands.Hands(min_detection_confidence=0.7, max_num_hands=MAX_HANDS)
+        # Cada mano tiene su id y su propio voto de gestos (ver seguimiento_manos.py)
+        self.hand_tracker = HandTracker(default_label)
+        self.classifier = self.load_classifier()
+
+    def load_classifier(self):
+        # Con un modelo entrenado (entrenar.py) se usa en lugar de las reglas fijas
+        if not os.path.exists(MODEL_PATH):
+            print("Clasificador: reglas fijas (no hay modelo entrenado)")
+            return None
+        try:
+            model = KnnGestureClassifier.load(MODEL_PATH, unknown_label=self.default_label)
+            print(f"Clasificador aprendido: {', '.join(model.labels)}")
+            return model
+        except Exception as e:
+            print(f"Error cargando clasificador: {e}")
+            return None
+
+    @property
+    def hands_description(self):
+        return self.hands.describe() if self.adaptive else "Hands fijo"
+
+    def classify_gesture(self, hand_landmarks):
+        """Devuelve (gesto, confianza) para una mano."""
+        labels, confidence = self.classify_hands(landmarks_to_array(hand_landmarks)[None])
+        return labels[0], float(confidence[0])
+
+    def classify_hands(self, points):
+        """Clasifica todas las manos del cuadro (N, 21, 3) en una sola llamada."""
+        if self.classifier:
+            return self.classifier.predict(normalize_landmarks(points))
+        return self.classify_hands_rules(points), np.ones(len(points), dtype=np.float32)
+
+    def classify_hands_rules(self, points):
+        # Dedo extendido: la punta está por encima de la articulación PIP
+        up = points[:, FINGER_TIPS, 1] < points[:, FINGER_PIPS, 1]
+        index, middle, ring, pinky = up.T
+
+        labels = np.full(len(points), self.default_label, dtype=object)
+        labels[~up.any(axis=1)] = "PUÑO"
+        labels[up.all(axis=1)] = "PALMA"
+        labels[index & ~middle & ~ring & ~pinky] = "DEDO"
+        labels[index & middle & ~ring & ~pinky] = "TIJERA"
+        return labels.tolist()
+
+    def process_hands(self, frame_rgb):
+        """Devuelve (results, fresh); fresh=False si el cuadro se saltó."""
+        if self.adaptive:
+            return self.hands.process(frame_rgb)
+        return self.hands.process(frame_rgb), True
+
+    def read_hands(self, results):
+        """Landmarks (N, 21, 3) y lateralidad de las manos detectadas en un cuadro."""
+        hls = results.multi_hand_landmarks or []
+        if not hls:
+            return np.empty((0, 21, 3), dtype=np.float32), []
+        points = np.stack([landmarks_to_array(hl) for hl in hls])
+        handedness = [HANDEDNESS_ES.get(h.classification[0].label, h.classification[0].label)
+                      for h in (results.multi_handedness or [])]
+        handedness += ["?"] * (len(hls) - len(handedness))
+        return points, handedness
+
+    def track_hands(self, points, handedness, labels, confidences):
+        """Sigue y suaviza las manos clasificadas; devuelve (estados, etiqueta por mano)."""
+        centers = points[:, :, :2].mean(axis=1)
+        states = self.hand_tracker.update(centers, handedness, labels, confidences)
+        gestures = {tid: g for tid, _, g in states}
+        hand_labels = [(tid, gestures[tid]) for tid in self.hand_tracker.last_assigned]
+        return states, hand_labels
+
+    def update_hands(self, results):
+        """Clasifica y sigue las manos de un cuadro procesado; devuelve (estados, etiqueta por mano)."""
+        points, handedness = self.read_hands(results)
+        labels, confidences = self.classify_hands(points) if len(points) else ([], [])
+        return self.track_hands(points, handedness, labels, confidences)
+
+    def close(self):
+        self.hands.close()
@@ -0,0 +1,71 @@
+import numpy as np
+
+from suavizado import VOTE_WINDOW, VOTE_ENTER, VOTE_EXIT, GestureSmoother
+
+# Distancia máxima (coordenadas normalizadas) para considerar que es la misma mano
+MATCH_DISTANCE = 0.2
+# Penalización si la lateralidad no coincide (MediaPipe a veces la invierte)
+HANDEDNESS_PENALTY = 0.1
+# Cuadros sin ver una mano antes de olvidarla
+MAX_MISSING_FRAMES = 5
+
+
+class HandTracker:
+    """Identidad estable por mano entre cuadros, con su propio suavizado de gesto."""
+
+    def __init__(self, default_label, max_distance=MATCH_DISTANCE, max_missing=MAX_MISSING_FRAMES):
+        self.default_label = default_label
+        self.max_distance = max_distance
+        self.max_missing = max_missing
+        self.tracks = {}
+        self.next_id = 1
+        self.last_assigned = []
+
+    def _match(self, centers, handedness):
+        """Asignación golosa por distancia entre detecciones y manos conocidas."""
+        ids = list(self.tracks)
+        assigned = [None] * len(centers)
+        if not ids or not len(centers):
+            return assigned
+
+        known = np.array([self.tracks[i]['center'] for i in ids])
+        d = np.linalg.norm(centers[:, None, :] - known[None, :, :], axis=2)
+        known_hand = np.array([self.tracks[i]['handedness'] for i in ids])
+        d += HANDEDNESS_PENALTY * (np.array(handedness)[:, None] != known_hand[None, :])
+
+        used = set()
+        for flat in np.argsort(d, axis=None):
+            det, trk = divmod(int(flat), len(ids))
+            if d[det, trk] > self.max_distance:
+                break
+            if assigned[det] is None and trk not in used:
+                assigned[det] = ids[trk]
+                used.add(trk)
+        return assigned
+
+    def update(self, centers, handedness, labels, confidences):
+        """Actualiza con las manos del cuadro; devuelve [(id, lateralidad, gesto estable), ...]."""
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        assigned = self._match(centers, handedness)
+
+        for track in self.tracks.values():
+            track['missing'] += 1
+
+        for i, track_id in enumerate(assigned):
+            if track_id is None:
+                track_id = assigned[i] = self.next_id
+                self.next_id += 1
+                self.tracks[track_id] = {
+                    'smoother': GestureSmoother(self.default_label, VOTE_WINDOW, VOTE_ENTER, VOTE_EXIT),
+                }
+            track = self.tracks[track_id]
+            track['center'] = centers[i]
+            track['handedness'] = handedness[i]
+            track['missing'] = 0
+            track['gesture'] = track['smoother'].update(labels[i], confidences[i])
+
+        self.last_assigned = assigned
+        for track_id in [t for t, d in self.tracks.items() if d['missing'] > self.max_missing]:
+            del self.tracks[track_id]
+
+        return [(tid, d['handedness'], d['gesture']) for tid, d in sorted(self.tracks.items())]
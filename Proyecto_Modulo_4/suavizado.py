@@ -0,0 +1,61 @@
+import numpy as np
+
+# Cuadros en la ventana de votación
+VOTE_WINDOW = 5
+# Fracción de los votos de la ventana para adoptar un gesto nuevo
+VOTE_ENTER = 0.6
+# El gesto actual se mantiene mientras conserve al menos esta fracción (histéresis)
+VOTE_EXIT = 0.4
+
+
+class GestureSmoother:
+    """Voto por mayoría sobre un buffer circular de predicciones por cuadro.
+
+    Un gesto nuevo se adopta en cuanto junta VOTE_ENTER de la ventana, sin
+    esperar un tiempo fijo; un cuadro mal clasificado no alcanza para
+    cambiarlo ni reinicia nada. Cada cuadro es un voto, también las poses
+    rechazadas (etiqueta por defecto con confianza 0); la confianza solo
+    desempata.
+    """
+
+    def __init__(self, default_label, window=VOTE_WINDOW, enter=VOTE_ENTER, exit=VOTE_EXIT):
+        self.default_label = default_label
+        self.window = window
+        self.enter = enter
+        self.exit = exit
+        self.label_ids = {default_label: 0}
+        self.labels = [default_label]
+        self.pred = np.full(window, -1, dtype=np.int32)  # -1: casilla vacía
+        self.conf = np.zeros(window, dtype=np.float32)
+        self.pos = 0
+        self.current = default_label
+
+    def _label_id(self, label):
+        if label not in self.label_ids:
+            self.label_ids[label] = len(self.labels)
+            self.labels.append(label)
+        return self.label_ids[label]
+
+    def update(self, label, confidence=1.0):
+        """Agrega la predicción del cuadro y devuelve el gesto estable."""
+        self.pred[self.pos] = self._label_id(label)
+        self.conf[self.pos] = confidence
+        self.pos = (self.pos + 1) % self.window
+
+        votes = self.pred[self.pred >= 0]
+        counts = np.bincount(votes, minlength=len(self.labels))
+        weights = np.bincount(votes, weights=self.conf[self.pred >= 0], minlength=len(self.labels))
+        share = counts / self.window
+        # Mayor cantidad de votos; a igualdad, mayor confianza acumulada
+        best = int(np.lexsort((weights, counts))[-1])
+        current = self.label_ids[self.current]
+
+        if best != current and share[best] >= self.enter and share[current] < self.exit:
+            self.current = self.labels[best]
+        return self.current
+
+    def reset(self):
+        self.pred[:] = -1
+        self.conf[:] = 0.0
+        self.pos = 0
+        self.current = self.default_label
@@ -0,0 +1,55 @@
+from clasificador_gestos import FEATURE_SIZE, KnnGestureClassifier
+from suavizado import VOTE_WINDOW, GestureSmoother
+
+
+def _feed(smoother, label, confidence, n):
+    for _ in range(n):
+        result = smoother.update(label, confidence)
+    return result
+
+
+def test_gesto_estable_se_adopta():
+    smoother = GestureSmoother("NINGUNO")
+    assert _feed(smoother, "OK", 1.0, 2) == "NINGUNO"
+    assert smoother.update("OK", 1.0) == "OK"
+
+
+def test_confianza_baja_constante_se_adopta():
+    # Confianza de kNN típica con 5 vecinos y 3 de acuerdo
+    smoother = GestureSmoother("NINGUNO")
+    assert _feed(smoother, "OK", 0.55, VOTE_WINDOW) == "OK"
+
+
+def test_poses_rechazadas_vuelven_a_desconocido():
+    model = KnnGestureClassifier(k=1, reject_distance=0.5).fit([[0.0] * FEATURE_SIZE], [0], ["OK"])
+    smoother = GestureSmoother("NINGUNO")
+
+    labels, conf = model.predict([[0.0] * FEATURE_SIZE])
+    assert _feed(smoother, labels[0], conf[0], VOTE_WINDOW) == "OK"
+
+    labels, conf = model.predict([[10.0] * FEATURE_SIZE])
+    assert labels[0] == "NINGUNO" and conf[0] == 0.0
+    assert _feed(smoother, labels[0], conf[0], VOTE_WINDOW) == "NINGUNO"
+
+
+def test_un_cuadro_rechazado_no_cambia_el_gesto():
+    smoother = GestureSmoother("NINGUNO")
+    _feed(smoother, "OK", 1.0, VOTE_WINDOW)
+    assert smoother.update("NINGUNO", 0.0) == "OK"
+
+
+def test_histeresis_al_salir():
+    smoother = GestureSmoother("NINGUNO")
+    _feed(smoother, "OK", 1.0, VOTE_WINDOW)
+    # Con 3 de 5 votos el gesto nuevo llega a VOTE_ENTER, pero OK conserva VOTE_EXIT
+    assert _feed(smoother, "PAZ", 1.0, 3) == "OK"
+    assert smoother.update("PAZ", 1.0) == "PAZ"
+
+
+def test_reset_vacia_la_ventana():
+    smoother = GestureSmoother("NINGUNO")
+    _feed(smoother, "OK", 1.0, VOTE_WINDOW)
+    smoother.reset()
+    assert smoother.current == "NINGUNO"
+    assert _feed(smoother, "OK", 1.0, 2) == "NINGUNO"
+    assert smoother.update("OK", 1.0) == "OK"
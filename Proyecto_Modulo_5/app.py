@@ -1,14 +1,21 @@
+import argparse
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageOps, ImageDraw
-import cv2
-import easyocr
+from PIL import ImageTk
 import threading
 import queue
 import time
 import numpy as np
 from collections import deque
 
+from dibujo_placas import DISPLAY_SIZE, draw_plates, fit_display, rounded_mask
+from fuentes import SPEEDS, create_source
+from ocr_placas import PlateOcr, create_reader
+from pool_ocr import OcrWorkerPool
+from registro_placas import SightingStore
+from seguimiento_placas import PlateTracker
+from vigilancia import Watchlist
+
 COLOR_BG = "#f5f7fa"          
 COLOR_CARD = "#ffffff"        
 COLOR_FG = "#2c3e50"          
@@ -29,157 +36,89 @@ CAMERA_HEIGHT = 720
 VIDEO_FPS = 30
 
 PROCESS_EVERY_N_FRAMES = 6
-PROCESS_SCALE_FACTOR = 0.5
-DISPLAY_SCALE = 0.8
-
-MIN_CONFIDENCE = 0.25
-MIN_PLATE_CHARS = 4
-MAX_TRACKING_AGE = 1.0
-IOU_THRESHOLD = 0.25
-
-class PlateTracker:
-    """Maneja el seguimiento de placas detectadas."""
-    
-    def __init__(self):
-        self.tracked_plates = {}
-        self.next_id = 0
-    
-    def _calculate_iou(self, box1, box2):
-        """Calcula IoU entre dos bounding boxes."""
-        def bbox_to_rect(bbox):
-            xs = [p[0] for p in bbox]
-            ys = [p[1] for p in bbox]
-            return [min(xs), min(ys), max(xs), max(ys)]
-        
-        r1 = bbox_to_rect(box1)
-        r2 = bbox_to_rect(box2)
-        
-        x_left = max(r1[0], r2[0])
-        y_top = max(r1[1], r2[1])
-        x_right = min(r1[2], r2[2])
-        y_bottom = min(r1[3], r2[3])
-        
-        if x_right < x_left or y_bottom < y_top:
-            return 0.0
-        
-        intersection = (x_right - x_left) * (y_bottom - y_top)
-        area1 = (r1[2] - r1[0]) * (r1[3] - r1[1])
-        area2 = (r2[2] - r2[0]) * (r2[3] - r2[1])
-        
-        union = area1 + area2 - intersection
-        return intersection / union if union > 0 else 0.0
-    
-    def update(self, detections, current_time):
-        """Actualiza tracking con nuevas detecciones."""
-        to_remove = [pid for pid, data in self.tracked_plates.items() 
-                     if current_time - data['last_seen'] > MAX_TRACKING_AGE]
-        for pid in to_remove:
-            del self.tracked_plates[pid]
-        
-        for bbox, text, conf in detections:
-            best_match = None
-            best_iou = IOU_THRESHOLD
-            
-            for pid, data in self.tracked_plates.items():
-                iou = self._calculate_iou(bbox, data['bbox'])
-                if iou > best_iou:
-                    best_iou = iou
-                    best_match = pid
-            
-            if best_match:
-                old = self.tracked_plates[best_match]
-                new_conf = old['confidence'] * 0.6 + conf * 0.4
-                new_text = text if conf > old['best_conf'] else old['text']
-                best_conf = max(conf, old['best_conf'])
-                
-                self.tracked_plates[best_match] = {
-                    'bbox': bbox,
-                    'text': new_text,
-                    'confidence': new_conf,
-                    'best_conf': best_conf,
-                    'last_seen': current_time,
-                    'detections': old['detections'] + 1
-                }
-            else:
-                self.tracked_plates[self.next_id] = {
-                    'bbox': bbox,
-                    'text': text,
-                    'confidence': conf,
-                    'best_conf': conf,
-                    'last_seen': current_time,
-                    'detections': 1
-                }
-                self.next_id += 1
-        
-        return [(d['bbox'], d['text'], d['confidence']) 
-                for d in self.tracked_plates.values()
-                if d['detections'] >= 2]
-    
-    def get_all_active(self, current_time):
-        """Obtiene todas las placas activas."""
-        return [(d['bbox'], d['text'], d['confidence']) 
-                for d in self.tracked_plates.values()
-                if current_time - d['last_seen'] < MAX_TRACKING_AGE]
 
+# Procesos de OCR, cada uno con su lector de EasyOCR (1: un hilo en este proceso).
+# Con N procesos se ofrece al OCR 1 de cada PROCESS_EVERY_N_FRAMES // N cuadros.
+# Cada proceso agrupa sus cuadros en lotes como el hilo, pero carga su propio
+# modelo (memoria y arranque por proceso): por eso el valor por defecto es 1.
+OCR_WORKERS = 1
+OCR_WORKERS_GPU = False
+
+# Cuadros enviados al OCR que se conservan para recortar la miniatura de cada avistamiento
+THUMBNAIL_FRAMES = 16
 
 class LicensePlateRecognizer:
-    def __init__(self, app_queue):
+    def __init__(self, app_queue, source=0, speed="nativo", headless=False):
         self.app_queue = app_queue
+        self.source_spec = source
+        self.speed = speed
+        # Sin interfaz no se publican cuadros de video en app_queue
+        self.headless = headless
         self.cap = None
         self.running = False
         self.processing = False
+        self.capture_done = False
+        self.started_at = None
+        
+        # Métricas de rendimiento (ver rendimiento_placas.py)
+        self.stats = {"frames": 0, "ocr_frames": 0, "ocr_calls": 0, "plates": 0}
+        self.latencies_ms = []
+        self.submitted = {}
         
         self.tracker = PlateTracker()
+        self.ocr = PlateOcr()
+        self.pool = None
+        if OCR_WORKERS > 1:
+            # Cada proceso carga su lector en paralelo; _result_loop avisa cuando hay uno listo
+            print(f"Iniciando {OCR_WORKERS} procesos de OCR...")
+            self.pool = OcrWorkerPool(OCR_WORKERS, gpu=OCR_WORKERS_GPU)
+        self.process_every = max(1, PROCESS_EVERY_N_FRAMES // max(1, OCR_WORKERS))
         self.frame_counter = 0
         self.process_queue = queue.Queue(maxsize=1)
+        self.ocr_frames = deque(maxlen=THUMBNAIL_FRAMES)
         
-        self.reader = None
-        self.reader_ready = False
-        threading.Thread(target=self._init_easyocr, daemon=True).start()
+        # Avistamientos confirmados a SQLite (hilo escritor propio) y lista de placas buscadas
+        self.store = SightingStore()
+        self.watchlist = Watchlist.load()
+        if len(self.watchlist):
+            print(f"Lista de vigilancia: {len(self.watchlist)} placa(s)")
         
-        self.allow_list = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ-'
+        self.reader_ready = False
+        if not self.pool:
+            threading.Thread(target=self._init_easyocr, daemon=True).start()
 
     def _init_easyocr(self):
         """Inicializa EasyOCR."""
         try:
             print("Cargando EasyOCR...")
-            self.reader = easyocr.Reader(
-                ['es', 'en'], 
-                gpu=True, 
-                verbose=False,
-                quantize=True
-            )
+            self.ocr.reader, gpu = create_reader()
             self.reader_ready = True
-            print("EasyOCR listo (GPU)")
-            self.app_queue.put(("status", "EasyOCR listo", COLOR_SUCCESS))
-        except Exception as e:
-            try:
-                print(f"GPU no disponible: {e}")
-                self.reader = easyocr.Reader(['es', 'en'], gpu=False, verbose=False)
-                self.reader_ready = True
+            if gpu:
+                print("EasyOCR listo (GPU)")
+                self.app_queue.put(("status", "EasyOCR listo", COLOR_SUCCESS))
+            else:
                 print("EasyOCR listo (CPU)")
                 self.app_queue.put(("status", "EasyOCR listo (CPU)", COLOR_WARNING))
-            except Exception as e2:
-                print(f"Error: {e2}")
-                self.app_queue.put(("error", "easyocr_error"))
+        except Exception as e:
+            print(f"Error: {e}")
+            self.app_queue.put(("error", "easyocr_error"))
 
     def start(self):
         try:
-            self.cap = cv2.VideoCapture(0)
+            self.cap = create_source(self.source_spec, self.speed,
+                                     CAMERA_WIDTH, CAMERA_HEIGHT, VIDEO_FPS)
             if not self.cap.isOpened():
                 self.app_queue.put(("error", "camera_error"))
                 return
             
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
-            self.cap.set(cv2.CAP_PROP_FPS, VIDEO_FPS)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-            self.cap.set(cv2.CAP_PROP_AUTOFOCUS, 1)
-            
             self.running = True
             
             threading.Thread(target=self._capture_loop, daemon=True).start()
-            threading.Thread(target=self._processing_loop, daemon=True).start()
+            if OCR_WORKERS > 1:
+                threading.Thread(target=self._dispatch_loop, daemon=True).start()
+                threading.Thread(target=self._result_loop, daemon=True).start()
+            else:
+                threading.Thread(target=self._processing_loop, daemon=True).start()
             
         except Exception as e:
             self.app_queue.put(("error", f"Error: {e}"))
@@ -188,6 +127,9 @@ class LicensePlateRecognizer:
         self.running = False
         if self.cap:
             self.cap.release()
+        if self.pool:
+            self.pool.close()
+        self.store.close()
         print("Detenido")
 
     def _capture_loop(self):
@@ -195,105 +137,204 @@ class LicensePlateRecognizer:
         while self.running:
             if not self.cap or not self.cap.isOpened():
                 break
+            
+            # Una reproducción espera al OCR antes de leer: así su reloj no
+            # corre (ni salta cuadros) mientras se carga el modelo
+            if self.cap.replay and not self.reader_ready:
+                time.sleep(0.05)
+                continue
                 
-            ret, frame = self.cap.read()
+            ret, frame, current_time = self.cap.read()
             if not ret:
+                if self.cap.finished:
+                    break
                 time.sleep(0.01)
                 continue
 
             self.frame_counter += 1
+            # Las métricas cuentan desde que el OCR está listo (ver rendimiento_placas.py)
+            if self.reader_ready:
+                if self.started_at is None:
+                    self.started_at = time.perf_counter()
+                self.stats["frames"] += 1
             
-            current_time = time.time()
-            active_plates = self.tracker.get_all_active(current_time)
+            if not self.headless:
+                active_plates = self.tracker.get_all_active(current_time)
+                self.app_queue.put(("video_frame", frame, active_plates))
             
-            self.app_queue.put(("video_frame", frame, active_plates))
-            
-            if (self.frame_counter % PROCESS_EVERY_N_FRAMES == 0 and 
-                self.reader_ready and not self.processing):
-                
-                while not self.process_queue.empty():
-                    try:
-                        self.process_queue.get_nowait()
-                    except:
-                        break
-                
-                try:
-                    self.process_queue.put_nowait((frame.copy(), current_time))
-                except:
-                    pass
+            if self.frame_counter % self.process_every == 0:
+                if self.cap.live:
+                    if self._can_process():
+                        while not self.process_queue.empty():
+                            try:
+                                self.process_queue.get_nowait()
+                            except:
+                                break
+                        
+                        try:
+                            self._submit(frame, current_time, block=False)
+                        except:
+                            pass
+                else:
+                    # Reproducción sin descartes: la lectura espera al OCR
+                    while self.running and not self._can_process():
+                        time.sleep(0.005)
+                    self._submit(frame, current_time, block=True)
             
-            time.sleep(0.001)
+            if self.cap.live:
+                time.sleep(0.001)
+        self.capture_done = True
+
+    def _submit(self, frame, timestamp, block):
+        ocr_frame = frame.copy()
+        self.submitted[timestamp] = time.perf_counter()
+        try:
+            if block:
+                self.process_queue.put((ocr_frame, timestamp))
+            else:
+                self.process_queue.put_nowait((ocr_frame, timestamp))
+        except queue.Full:
+            del self.submitted[timestamp]
+            raise
+        self.stats["ocr_frames"] += 1
+        self.ocr_frames.append((timestamp, ocr_frame))
+
+    @property
+    def idle(self):
+        """True cuando la fuente terminó y no queda OCR pendiente."""
+        return (self.capture_done and self.process_queue.empty() and not self.submitted)
+
+    def _can_process(self):
+        if self.pool:
+            return self.pool.has_capacity()
+        return self.reader_ready and not self.processing
+
+    def _apply_detections(self, detections, timestamp):
+        try:
+            if detections:
+                tracked = self.tracker.update(detections, timestamp)
+                if tracked:
+                    texts = [t for _, t, _ in tracked]
+                    self.app_queue.put(("status", 
+                                      f"{len(tracked)} placa(s): {', '.join(texts[:2])}", 
+                                      COLOR_SUCCESS))
+                for track_id, bbox, text, conf in self.tracker.last_confirmed:
+                    self.stats["plates"] += 1
+                    self._record_sighting(track_id, bbox, text, conf, timestamp)
+                for track_id, _, text, conf in self.tracker.last_improved:
+                    # Lectura mejor de una placa ya guardada: se corrige su avistamiento
+                    self.store.update(track_id, text, conf)
+                    self._check_watchlist(text)
+        finally:
+            # Se libera al final: 'idle' no se cumple hasta contar y guardar las placas
+            sent = self.submitted.pop(timestamp, None)
+            if sent is not None:
+                self.latencies_ms.append((time.perf_counter() - sent) * 1000)
+
+    def _plate_crop(self, bbox, timestamp):
+        """Recorte de la placa en el cuadro original, si todavía se conserva."""
+        for ts, frame in reversed(list(self.ocr_frames)):
+            if ts == timestamp:
+                pts = np.asarray(bbox)
+                x1, y1 = np.maximum(pts.min(axis=0), 0)
+                x2, y2 = pts.max(axis=0)
+                return frame[y1:y2, x1:x2]
+        return None
+
+    def _record_sighting(self, track_id, bbox, text, conf, timestamp):
+        self.store.record(text, conf, timestamp, self._plate_crop(bbox, timestamp), track_id)
+        self._check_watchlist(text)
+
+    def _check_watchlist(self, text):
+        match = self.watchlist.match(text)
+        if match:
+            plate, distance = match
+            detail = "" if distance == 0 else f" (leída {text})"
+            print(f"ALERTA: placa en lista de vigilancia {plate}{detail}")
+            self.app_queue.put(("status", f"ALERTA: {plate}{detail}", COLOR_ERROR))
 
     def _processing_loop(self):
         """Loop de procesamiento OCR"""
         while self.running:
             try:
-                frame, timestamp = self.process_queue.get(timeout=1.0)
-                
+                # Si hay un lote pendiente solo se espera hasta su vencimiento
+                wait = self.ocr.wait_time()
+                frame, timestamp = self.process_queue.get(
+                    timeout=1.0 if wait is None else max(wait, 0.001))
+            except queue.Empty:
+                frame = None
+            
+            if frame is not None:
                 if not self.reader_ready:
+                    self.submitted.pop(timestamp, None)
                     continue
                 
-                self.processing = True
-                
-                h, w = frame.shape[:2]
-                small_w = int(w * PROCESS_SCALE_FACTOR)
-                small_h = int(h * PROCESS_SCALE_FACTOR)
-                small_frame = cv2.resize(frame, (small_w, small_h), 
-                                        interpolation=cv2.INTER_LINEAR)
-                
-                gray = cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY)
-                
-                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-                enhanced = clahe.apply(gray)
-                
-                kernel = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]])
-                sharpened = cv2.filter2D(enhanced, -1, kernel)
-                
-                results = self.reader.readtext(
-                    sharpened,
-                    detail=1,
-                    allowlist=self.allow_list,
-                    paragraph=False,
-                    batch_size=1,
-                    text_threshold=0.6,
-                    low_text=0.3,
-                    link_threshold=0.3
-                )
-                
-                scale_inv = 1.0 / PROCESS_SCALE_FACTOR
-                detections = []
-                
-                for bbox, text, prob in results:
-                    if prob >= MIN_CONFIDENCE:
-                        text_clean = "".join(text.split()).upper()
-                        
-                        if (len(text_clean) >= MIN_PLATE_CHARS and 
-                            any(c.isdigit() for c in text_clean)):
-                            
-                            scaled_bbox = [[int(p[0]*scale_inv), int(p[1]*scale_inv)] 
-                                          for p in bbox]
-                            detections.append((scaled_bbox, text_clean, prob))
-                
-                if detections:
-                    tracked = self.tracker.update(detections, timestamp)
-                    if tracked:
-                        texts = [t for _, t, _ in tracked]
-                        self.app_queue.put(("status", 
-                                          f"{len(tracked)} placa(s): {', '.join(texts[:2])}", 
-                                          COLOR_SUCCESS))
-                
-                self.processing = False
-                
-            except queue.Empty:
-                self.processing = False
+                calls = self.ocr.calls
+                try:
+                    self.ocr.add(self.ocr.preprocess(frame), timestamp)
+                except Exception as e:
+                    self.submitted.pop(timestamp, None)
+                    print(f"Error OCR: {e}")
+                    time.sleep(0.1)
+                self.stats["ocr_calls"] += self.ocr.calls - calls
+            
+            if not self.ocr.due():
+                continue
+            
+            self.processing = True
+            # flush() vacía el lote antes de reconocer: si falla, sus cuadros se liberan aquí
+            batch = self.ocr.pending_timestamps()
+            calls = self.ocr.calls
+            try:
+                for timestamp, detections in self.ocr.flush():
+                    self._apply_detections(detections, timestamp)
             except Exception as e:
+                for timestamp in batch:
+                    self.submitted.pop(timestamp, None)
                 print(f"Error OCR: {e}")
-                self.processing = False
                 time.sleep(0.1)
+            self.stats["ocr_calls"] += self.ocr.calls - calls
+            self.processing = False
+
+    def _dispatch_loop(self):
+        """Preprocesa y reparte cuadros entre los procesos de OCR"""
+        while self.running:
+            try:
+                frame, timestamp = self.process_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            # Solo viaja la imagen reducida en gris: ~12 veces menos datos entre procesos
+            try:
+                sent = self.pool.submit(self.ocr.preprocess(frame), timestamp)
+            except Exception as e:
+                print(f"Error OCR: {e}")
+                sent = False
+            if not sent:
+                self.submitted.pop(timestamp, None)
+
+    def _result_loop(self):
+        """Recibe resultados del pool en orden de captura y actualiza el tracker"""
+        while self.running:
+            for timestamp, detections, _, calls in self.pool.results(timeout=0.1):
+                self.stats["ocr_calls"] += calls
+                if detections is None:
+                    # El pool lo dio por perdido (proceso caído o colgado)
+                    self.submitted.pop(timestamp, None)
+                    continue
+                self._apply_detections(detections, timestamp)
+            
+            if not self.reader_ready and self.pool.ready:
+                self.reader_ready = True
+                self.app_queue.put(("status", 
+                                  f"EasyOCR listo ({self.pool.ready}/{OCR_WORKERS} procesos)", 
+                                  COLOR_SUCCESS))
+            elif not self.pool.ready and len(self.pool.errors) == OCR_WORKERS:
+                self.app_queue.put(("error", "easyocr_error"))
+                break
 
 
 class PlateRecognitionApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, source=0, speed="nativo"):
         super().__init__()
         self.title("🚗 Reconocimiento de Placas Vehiculares")
         self.geometry("920x750")
@@ -303,7 +344,7 @@ class PlateRecognitionApp(tk.Tk):
         self.center_window()
 
         self.app_queue = queue.Queue()
-        self.recognizer = LicensePlateRecognizer(self.app_queue)
+        self.recognizer = LicensePlateRecognizer(self.app_queue, source, speed)
         
         self.style = ttk.Style(self)
         self.style.theme_use("clam")
@@ -407,61 +448,12 @@ class PlateRecognitionApp(tk.Tk):
         # CORRECCIÓN: Inicializar last_frame_time correctamente
         self.last_frame_time = time.time()
         self.fps_history = deque(maxlen=10)
+        # La máscara de esquinas redondeadas no cambia: se construye una sola vez
+        self.display_mask = rounded_mask(DISPLAY_SIZE)
 
     def draw_results(self, frame, results):
-        """Dibuja detecciones con estilo moderno"""
-        for bbox, text, conf in results:
-            conf_pct = int(conf * 100)
-            
-            if conf_pct >= 70:
-                color = (16, 185, 129)  
-                thickness = 3
-            elif conf_pct >= 50:
-                color = (59, 130, 246)  
-                thickness = 2
-            else:
-                color = (245, 158, 11)  
-                thickness = 2
-            
-            pts = np.array(bbox, dtype=np.int32)
-
-            cv2.polylines(frame, [pts], True, (209, 213, 219), thickness+2)
-            cv2.polylines(frame, [pts], True, color, thickness)
-
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            top_left = tuple(pts[0])
-            
-            (tw, th), bl = cv2.getTextSize(text, font, 0.8, 2)
-            ty = max(top_left[1] - 12, th + 22)
-
-            overlay = frame.copy()
-            cv2.rectangle(overlay, 
-                         (top_left[0]-8, ty-th-bl-8),
-                         (top_left[0]+tw+8, ty+bl+8),
-                         color, -1)
-            cv2.addWeighted(overlay, 0.9, frame, 0.1, 0, frame)
-
-            cv2.rectangle(frame,
-                         (top_left[0]-8, ty-th-bl-8),
-                         (top_left[0]+tw+8, ty+bl+8),
-                         color, 2)
-
-            cv2.putText(frame, text, (top_left[0], ty), 
-                       font, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
-
-            badge_text = f"{conf_pct}%"
-            (bw, bh), _ = cv2.getTextSize(badge_text, font, 0.4, 1)
-            badge_x = top_left[0] + tw - bw + 4
-            badge_y = ty + 20
-            
-            cv2.rectangle(frame,
-                         (badge_x-4, badge_y-bh-4),
-                         (badge_x+bw+4, badge_y+4),
-                         (255, 255, 255), -1)
-            cv2.putText(frame, badge_text, (badge_x, badge_y),
-                       font, 0.4, color, 1, cv2.LINE_AA)
-        
-        return frame
+        """Dibuja detecciones con estilo moderno (ver dibujo_placas.py)"""
+        return draw_plates(frame, results)
 
     def process_queue(self):
         """Procesa cola de mensajes"""
@@ -477,20 +469,8 @@ class PlateRecognitionApp(tk.Tk):
                     
                     frame_with_results = self.draw_results(frame_bgr, results)
                     
-                    display_h = int(frame_bgr.shape[0] * DISPLAY_SCALE)
-                    display_w = int(frame_bgr.shape[1] * DISPLAY_SCALE)
-                    display_frame = cv2.resize(frame_with_results, 
-                                              (display_w, display_h),
-                                              interpolation=cv2.INTER_LINEAR)
-                    
-                    img_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-                    img_pil = Image.fromarray(img_rgb)
-                    img_fit = ImageOps.fit(img_pil, (800, 450), Image.Resampling.BILINEAR)
-                    
-                    mask = Image.new('L', (800, 450), 0)
-                    draw = ImageDraw.Draw(mask)
-                    draw.rounded_rectangle((0, 0, 800, 450), 8, fill=255)
-                    img_fit.putalpha(mask)
+                    img_fit = fit_display(frame_with_results)
+                    img_fit.putalpha(self.display_mask)
                     
                     imgtk = ImageTk.PhotoImage(img_fit)
                     self.video_label.config(image=imgtk)
@@ -540,5 +520,11 @@ class PlateRecognitionApp(tk.Tk):
 
 
 if __name__ == "__main__":
-    app = PlateRecognitionApp()
+    parser = argparse.ArgumentParser(description="Reconocimiento de placas vehiculares.")
+    parser.add_argument("--fuente", default="0",
+                        help="Índice de cámara, archivo de video o carpeta de imágenes")
+    parser.add_argument("--velocidad", default="nativo", choices=SPEEDS,
+                        help="Ritmo de reproducción para videos y carpetas")
+    args = parser.parse_args()
+    app = PlateRecognitionApp(args.fuente, args.velocidad)
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,104 @@
+import argparse
+import time
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageOps
+
+from dibujo_placas import DISPLAY_SIZE, draw_plates, fit_display, plate_color, rounded_mask
+
+CAMERA_SIZE = (1280, 720)
+LEGACY_DISPLAY_SCALE = 0.8
+
+
+def draw_plates_full_frame(frame, results):
+    """Versión anterior: copia y mezcla el cuadro completo por cada placa (referencia)."""
+    for bbox, text, conf in results:
+        color, thickness = plate_color(int(conf * 100))
+        pts = np.array(bbox, dtype=np.int32)
+        cv2.polylines(frame, [pts], True, (209, 213, 219), thickness+2)
+        cv2.polylines(frame, [pts], True, color, thickness)
+        top_left = tuple(pts[0])
+        (tw, th), bl = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)
+        ty = max(top_left[1] - 12, th + 22)
+        overlay = frame.copy()
+        cv2.rectangle(overlay, (top_left[0]-8, ty-th-bl-8), (top_left[0]+tw+8, ty+bl+8), color, -1)
+        cv2.addWeighted(overlay, 0.9, frame, 0.1, 0, frame)
+        cv2.rectangle(frame, (top_left[0]-8, ty-th-bl-8), (top_left[0]+tw+8, ty+bl+8), color, 2)
+        cv2.putText(frame, text, (top_left[0], ty), cv2.FONT_HERSHEY_SIMPLEX, 0.8,
+                    (255, 255, 255), 2, cv2.LINE_AA)
+        badge_text = f"{int(conf * 100)}%"
+        (bw, bh), _ = cv2.getTextSize(badge_text, cv2.FONT_HERSHEY_SIMPLEX, 0.4, 1)
+        badge_x, badge_y = top_left[0] + tw - bw + 4, ty + 20
+        cv2.rectangle(frame, (badge_x-4, badge_y-bh-4), (badge_x+bw+4, badge_y+4), (255, 255, 255), -1)
+        cv2.putText(frame, badge_text, (badge_x, badge_y), cv2.FONT_HERSHEY_SIMPLEX, 0.4,
+                    color, 1, cv2.LINE_AA)
+    return frame
+
+
+def display_legacy(frame):
+    """Vista anterior: dos escalados y la máscara redondeada construida en cada cuadro."""
+    h, w = frame.shape[:2]
+    small = cv2.resize(frame, (int(w * LEGACY_DISPLAY_SCALE), int(h * LEGACY_DISPLAY_SCALE)),
+                       interpolation=cv2.INTER_LINEAR)
+    img = ImageOps.fit(Image.fromarray(cv2.cvtColor(small, cv2.COLOR_BGR2RGB)),
+                       DISPLAY_SIZE, Image.Resampling.BILINEAR)
+    mask = Image.new('L', DISPLAY_SIZE, 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, *DISPLAY_SIZE), 8, fill=255)
+    img.putalpha(mask)
+    return img
+
+
+def display_cached(frame, mask):
+    img = fit_display(frame)
+    img.putalpha(mask)
+    return img
+
+
+def random_plates(n, rng):
+    plates = []
+    for i in range(n):
+        x = int(rng.integers(20, CAMERA_SIZE[0] - 220))
+        y = int(rng.integers(60, CAMERA_SIZE[1] - 60))
+        bbox = [[x, y], [x + 200, y], [x + 200, y + 50], [x, y + 50]]
+        plates.append((bbox, f"ABC-{1000 + i}", float(rng.uniform(0.3, 0.95))))
+    return plates
+
+
+def measure(fn, repeats):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) * 1000 / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark del dibujo y la vista previa de placas.")
+    parser.add_argument("--placas", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--repeticiones", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (CAMERA_SIZE[1], CAMERA_SIZE[0], 3), dtype=np.uint8)
+    mask = rounded_mask(DISPLAY_SIZE)
+
+    print(f"{'ETAPA':<28} {'ANTES ms':>9} {'AHORA ms':>9} {'x':>6}")
+    print("-" * 55)
+    for n in args.placas:
+        plates = random_plates(n, rng)
+        diff = cv2.absdiff(draw_plates_full_frame(base.copy(), plates), draw_plates(base.copy(), plates))
+        before = measure(lambda: draw_plates_full_frame(base.copy(), plates), args.repeticiones)
+        after = measure(lambda: draw_plates(base.copy(), plates), args.repeticiones)
+        print(f"{f'dibujo {n} placa(s)':<28} {before:>9.2f} {after:>9.2f} {before / after:>6.1f}"
+              f"  (dif. máx. {int(diff.max())})")
+
+    copy_ms = measure(lambda: base.copy(), args.repeticiones)
+    before = measure(lambda: display_legacy(base), args.repeticiones)
+    after = measure(lambda: display_cached(base, mask), args.repeticiones)
+    print(f"{'vista 800x450 + máscara':<28} {before:>9.2f} {after:>9.2f} {before / after:>6.1f}")
+    print(f"(copia del cuadro incluida en 'dibujo': {copy_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+LABEL_ALPHA = 0.9
+DISPLAY_SIZE = (800, 450)
+
+
+def plate_color(conf_pct):
+    """Color (BGR) y grosor según la confianza."""
+    if conf_pct >= 70:
+        return (16, 185, 129), 3
+    if conf_pct >= 50:
+        return (59, 130, 246), 2
+    return (245, 158, 11), 2
+
+
+def blend_rect(frame, x1, y1, x2, y2, color, alpha=LABEL_ALPHA):
+    """Mezcla un rectángulo de color solo en su región del cuadro (no en la imagen completa)."""
+    h, w = frame.shape[:2]
+    x1, y1 = max(0, x1), max(0, y1)
+    x2, y2 = min(w, x2), min(h, y2)
+    if x2 <= x1 or y2 <= y1:
+        return
+    roi = frame[y1:y2, x1:x2]
+    block = np.empty_like(roi)
+    block[:] = color
+    frame[y1:y2, x1:x2] = cv2.addWeighted(block, alpha, roi, 1 - alpha, 0)
+
+
+def draw_plates(frame, results):
+    """Dibuja detecciones con estilo moderno"""
+    for bbox, text, conf in results:
+        conf_pct = int(conf * 100)
+        color, thickness = plate_color(conf_pct)
+
+        pts = np.array(bbox, dtype=np.int32)
+
+        cv2.polylines(frame, [pts], True, (209, 213, 219), thickness+2)
+        cv2.polylines(frame, [pts], True, color, thickness)
+
+        top_left = tuple(pts[0])
+
+        (tw, th), bl = cv2.getTextSize(text, FONT, 0.8, 2)
+        ty = max(top_left[1] - 12, th + 22)
+
+        label = (top_left[0]-8, ty-th-bl-8, top_left[0]+tw+8, ty+bl+8)
+        blend_rect(frame, *label, color)
+        cv2.rectangle(frame, label[:2], label[2:], color, 2)
+
+        cv2.putText(frame, text, (top_left[0], ty),
+                   FONT, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
+
+        badge_text = f"{conf_pct}%"
+        (bw, bh), _ = cv2.getTextSize(badge_text, FONT, 0.4, 1)
+        badge_x = top_left[0] + tw - bw + 4
+        badge_y = ty + 20
+
+        cv2.rectangle(frame,
+                     (badge_x-4, badge_y-bh-4),
+                     (badge_x+bw+4, badge_y+4),
+                     (255, 255, 255), -1)
+        cv2.putText(frame, badge_text, (badge_x, badge_y),
+                   FONT, 0.4, color, 1, cv2.LINE_AA)
+
+    return frame
+
+
+def fit_display(frame, size=DISPLAY_SIZE):
+    """Recorta al aspecto de la vista, escala una sola vez y devuelve una imagen PIL RGB."""
+    h, w = frame.shape[:2]
+    target = size[0] / size[1]
+    if w / h > target + 1e-3:
+        cw = int(round(h * target))
+        x0 = (w - cw) // 2
+        frame = frame[:, x0:x0 + cw]
+    elif w / h < target - 1e-3:
+        ch = int(round(w / target))
+        y0 = (h - ch) // 2
+        frame = frame[y0:y0 + ch]
+    frame = cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR)
+    return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+
+def rounded_mask(size=DISPLAY_SIZE, radius=8):
+    """Máscara L con esquinas redondeadas; se crea una vez y se reutiliza."""
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, *size), radius, fill=255)
+    return mask
@@ -0,0 +1,178 @@
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+# Velocidades de reproducción para archivos y carpetas:
+#   nativo      - al ritmo del video, sin descartar cuadros (el OCR puede frenar la lectura)
+#   tiempo_real - como una cámara: si el procesamiento se atrasa se saltan cuadros
+#   rapido      - tan rápido como se pueda procesar, sin descartar cuadros
+SPEEDS = ("nativo", "tiempo_real", "rapido")
+DEFAULT_FOLDER_FPS = 30
+
+
+class FrameSource:
+    """Fuente de cuadros: read() devuelve (ok, frame, timestamp).
+
+    'live' indica que los cuadros no esperan al OCR (cámara o tiempo real):
+    si el OCR está ocupado se descartan. En reproducción el timestamp es el
+    tiempo del medio (inicio + índice / fps), así el seguimiento envejece
+    las placas igual a cualquier velocidad.
+    """
+
+    live = True
+    replay = False
+    finished = False
+    fps = 0.0
+
+    def read(self):
+        raise NotImplementedError
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+class CameraSource(FrameSource):
+    def __init__(self, index=0, width=None, height=None, fps=None):
+        self.name = f"cámara {index}"
+        self.cap = cv2.VideoCapture(index)
+        if self.cap.isOpened():
+            if width:
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            if height:
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            if fps:
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.cap.set(cv2.CAP_PROP_AUTOFOCUS, 1)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or (fps or 0.0)
+
+    def read(self):
+        ret, frame = self.cap.read()
+        return ret, frame, time.time()
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+class _ReplaySource(FrameSource):
+    """Reproducción de cuadros indexados con control de velocidad.
+
+    El reloj arranca en la primera lectura. En 'nativo', si la lectura se
+    atrasa (p. ej. esperando al OCR) el reloj se corre en lugar de acelerar
+    para recuperar el tiempo perdido.
+    """
+
+    replay = True
+
+    def __init__(self, fps, speed):
+        if speed not in SPEEDS:
+            raise ValueError(f"Velocidad desconocida '{speed}', opciones: {', '.join(SPEEDS)}")
+        self.speed = speed
+        self.live = speed == "tiempo_real"
+        self.fps = fps or DEFAULT_FOLDER_FPS
+        self.index = 0
+        self.skipped = 0
+        self.start = None
+
+    def _grab(self):
+        """Avanza un cuadro sin decodificarlo; False al terminar."""
+        raise NotImplementedError
+
+    def _retrieve(self):
+        """Cuadro actual decodificado, o None al terminar."""
+        raise NotImplementedError
+
+    def read(self):
+        if self.finished:
+            return False, None, None
+        now = time.perf_counter()
+        if self.start is None:
+            self.start = now
+            self.wall_start = time.time()
+
+        if self.speed == "tiempo_real":
+            # Saltar los cuadros que una cámara ya habría entregado
+            behind = int((now - self.start) * self.fps) - self.index
+            for _ in range(max(0, behind)):
+                if not self._grab():
+                    self.finished = True
+                    return False, None, None
+                self.index += 1
+                self.skipped += 1
+
+        if self.speed != "rapido":
+            delay = self.start + self.index / self.fps - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif self.speed == "nativo":
+                self.start -= delay
+
+        frame = self._retrieve()
+        if frame is None:
+            self.finished = True
+            return False, None, None
+        timestamp = self.wall_start + self.index / self.fps
+        self.index += 1
+        return True, frame, timestamp
+
+
+class VideoFileSource(_ReplaySource):
+    def __init__(self, path, speed="nativo"):
+        self.name = os.path.basename(path)
+        self.cap = cv2.VideoCapture(path)
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS), speed)
+
+    def _grab(self):
+        return self.cap.grab()
+
+    def _retrieve(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageFolderSource(_ReplaySource):
+    def __init__(self, folder, speed="nativo", fps=DEFAULT_FOLDER_FPS):
+        self.name = os.path.basename(os.path.normpath(folder))
+        self.paths = sorted(p for p in glob.glob(os.path.join(folder, "*"))
+                            if p.lower().endswith(IMAGE_EXTENSIONS))
+        super().__init__(fps, speed)
+
+    def _grab(self):
+        return self.index < len(self.paths)
+
+    def _retrieve(self):
+        while self.index < len(self.paths):
+            frame = cv2.imdecode(np.fromfile(self.paths[self.index], dtype=np.uint8), cv2.IMREAD_COLOR)
+            if frame is not None:
+                return frame
+            print(f"Aviso: no se pudo leer '{self.paths[self.index]}'")
+            self.index += 1
+        return None
+
+    def isOpened(self):
+        return bool(self.paths)
+
+
+def create_source(spec=0, speed="nativo", width=None, height=None, fps=None):
+    """Cámara (índice), carpeta de imágenes o archivo de video según 'spec'."""
+    if isinstance(spec, int) or str(spec).isdigit():
+        return CameraSource(int(spec), width, height, fps)
+    if os.path.isdir(spec):
+        return ImageFolderSource(spec, speed)
+    return VideoFileSource(spec, speed)
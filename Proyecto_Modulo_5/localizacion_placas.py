@@ -0,0 +1,66 @@
+import cv2
+import numpy as np
+
+# Relación ancho/alto aceptada para una placa (incluye placas inclinadas o de moto)
+MIN_ASPECT = 1.8
+MAX_ASPECT = 8.0
+# Tamaño mínimo en píxeles de la imagen reducida y área máxima relativa al cuadro
+MIN_PLATE_WIDTH = 40
+MIN_PLATE_HEIGHT = 10
+MAX_AREA_FRACTION = 0.25
+# Margen alrededor de la región propuesta (fracción del alto) para no cortar caracteres
+PAD_FRACTION = 0.3
+MAX_PROPOSALS = 8
+
+
+class PlateLocalizer:
+    """Propone regiones de placa con morfología y contornos.
+
+    Los caracteres oscuros sobre fondo claro resaltan con black-hat; el
+    gradiente horizontal marca los bordes verticales de los caracteres y un
+    cierre con un kernel ancho los une en un bloque por placa. Solo esos
+    bloques, filtrados por tamaño y proporción, pasan al OCR.
+    """
+
+    def __init__(self, max_proposals=MAX_PROPOSALS):
+        self.max_proposals = max_proposals
+        self.rect_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (13, 5))
+        self.close_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (21, 5))
+        self.open_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+    def propose(self, gray):
+        """Devuelve cajas (N, 4) x1, y1, x2, y2 ordenadas por puntaje, en coordenadas de 'gray'."""
+        h, w = gray.shape[:2]
+        blackhat = cv2.morphologyEx(gray, cv2.MORPH_BLACKHAT, self.rect_kernel)
+
+        grad = np.abs(cv2.Sobel(blackhat, cv2.CV_32F, 1, 0, ksize=3))
+        grad = cv2.normalize(grad, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+        grad = cv2.GaussianBlur(grad, (5, 5), 0)
+        grad = cv2.morphologyEx(grad, cv2.MORPH_CLOSE, self.close_kernel)
+        _, mask = cv2.threshold(grad, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.open_kernel, iterations=2)
+
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return np.empty((0, 4), dtype=np.int32)
+
+        rects = np.array([cv2.boundingRect(c) for c in contours], dtype=np.float32)
+        x, y, bw, bh = rects.T
+        aspect = bw / np.maximum(bh, 1)
+        keep = ((aspect >= MIN_ASPECT) & (aspect <= MAX_ASPECT) &
+                (bw >= MIN_PLATE_WIDTH) & (bh >= MIN_PLATE_HEIGHT) &
+                (bw * bh <= MAX_AREA_FRACTION * w * h))
+        if not keep.any():
+            return np.empty((0, 4), dtype=np.int32)
+
+        x, y, bw, bh = x[keep], y[keep], bw[keep], bh[keep]
+        # Puntaje: densidad de bordes dentro de la región
+        fill = np.array([cv2.mean(grad[int(yy):int(yy + hh), int(xx):int(xx + ww)])[0]
+                         for xx, yy, ww, hh in zip(x, y, bw, bh)])
+        order = np.argsort(-fill)[:self.max_proposals]
+
+        pad = bh[order] * PAD_FRACTION
+        boxes = np.stack([x[order] - pad, y[order] - pad,
+                          x[order] + bw[order] + pad, y[order] + bh[order] + pad], axis=1)
+        boxes = np.clip(boxes, 0, [w, h, w, h])
+        return boxes.astype(np.int32)
@@ -0,0 +1,116 @@
+import time
+
+import numpy as np
+
+# Regiones máximas por llamada de reconocimiento
+OCR_MAX_BATCH = 8
+# Tiempo máximo (s) que una región espera a completar el lote
+OCR_MAX_LATENCY = 0.2
+# Separación vertical entre recortes dentro del mosaico
+MOSAIC_GAP = 4
+
+
+class OcrBatcher:
+    """Junta regiones de texto de varios cuadros y las reconoce en un solo lote.
+
+    Cada cuadro aporta su imagen preprocesada y sus cajas (x1, y1, x2, y2),
+    vengan del localizador de placas o de reader.detect(). Al vaciar el lote
+    los recortes se apilan en un mosaico y pasan por reader.recognize() de
+    una vez; cada resultado vuelve a su cuadro, con su marca de tiempo y en
+    coordenadas de ese cuadro. El lote se vacía al llegar a max_batch
+    regiones o cuando la más antigua lleva max_latency segundos esperando.
+    """
+
+    def __init__(self, reader, allowlist, max_batch=OCR_MAX_BATCH, max_latency=OCR_MAX_LATENCY):
+        self.reader = reader
+        self.allowlist = allowlist
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.pending = []
+        self.pending_crops = 0
+        self.oldest = None
+        self.batches = 0
+        self.crops = 0
+
+    def add(self, timestamp, image, boxes):
+        """Encola las regiones de un cuadro.
+
+        Un cuadro sin regiones también se encola (sin costo de OCR) para que
+        cada cuadro reciba su resultado, en orden.
+        """
+        boxes = np.asarray(boxes, dtype=np.int32).reshape(-1, 4)
+        h, w = image.shape[:2]
+        boxes = np.clip(boxes, 0, [w, h, w, h])
+        boxes = boxes[(boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])]
+        if len(boxes) and self.oldest is None:
+            self.oldest = time.perf_counter()
+        self.pending.append((timestamp, image, boxes))
+        self.pending_crops += len(boxes)
+
+    def due(self, now=None):
+        if not self.pending:
+            return False
+        if self.oldest is None:
+            return True  # solo cuadros sin regiones: se entregan de inmediato
+        now = time.perf_counter() if now is None else now
+        return self.pending_crops >= self.max_batch or now - self.oldest >= self.max_latency
+
+    def wait_time(self, now=None):
+        """Segundos hasta que el lote pendiente venza (None si está vacío)."""
+        if not self.pending:
+            return None
+        if self.oldest is None:
+            return 0.0
+        now = time.perf_counter() if now is None else now
+        return max(0.0, self.oldest + self.max_latency - now)
+
+    def flush(self):
+        """Reconoce todo lo pendiente; devuelve [(timestamp, [(bbox, texto, prob), ...]), ...]."""
+        pending, self.pending = self.pending, []
+        self.pending_crops = 0
+        self.oldest = None
+        if not pending:
+            return []
+        if not any(len(boxes) for _, _, boxes in pending):
+            return [(timestamp, []) for timestamp, _, _ in pending]
+
+        crops, origins = [], []
+        for frame_idx, (_, image, boxes) in enumerate(pending):
+            for x1, y1, x2, y2 in boxes:
+                crops.append(image[y1:y2, x1:x2])
+                origins.append((frame_idx, x1, y1))
+
+        # Mosaico vertical: una sola imagen y una caja horizontal por recorte
+        width = max(c.shape[1] for c in crops)
+        offsets = np.cumsum([0] + [c.shape[0] + MOSAIC_GAP for c in crops])
+        mosaic = np.zeros((int(offsets[-1]), width), dtype=crops[0].dtype)
+        horizontal_list = []
+        for crop, y0 in zip(crops, offsets[:-1]):
+            ch, cw = crop.shape[:2]
+            mosaic[y0:y0 + ch, :cw] = crop
+            horizontal_list.append([0, int(cw), int(y0), int(y0 + ch)])
+
+        results = self.reader.recognize(
+            mosaic,
+            horizontal_list=horizontal_list,
+            free_list=[],
+            detail=1,
+            allowlist=self.allowlist,
+            paragraph=False,
+            batch_size=len(horizontal_list)
+        )
+        self.batches += 1
+        self.crops += len(crops)
+
+        # recognize() ordena por posición: se identifica el recorte por su 'y' en el mosaico
+        per_frame = [[] for _ in pending]
+        for bbox, text, prob in results:
+            pts = np.asarray(bbox, dtype=np.float32)
+            i = int(np.searchsorted(offsets, pts[:, 1].min(), side="right")) - 1
+            i = min(max(i, 0), len(crops) - 1)
+            frame_idx, x1, y1 = origins[i]
+            pts[:, 0] += x1
+            pts[:, 1] += y1 - offsets[i]
+            per_frame[frame_idx].append((pts.tolist(), text, prob))
+
+        return [(timestamp, per_frame[i]) for i, (timestamp, _, _) in enumerate(pending)]
@@ -0,0 +1,126 @@
+import cv2
+import numpy as np
+
+from localizacion_placas import PlateLocalizer
+from lote_ocr import OCR_MAX_BATCH, OCR_MAX_LATENCY, OcrBatcher
+
+PROCESS_SCALE_FACTOR = 0.5
+
+MIN_CONFIDENCE = 0.25
+MIN_PLATE_CHARS = 4
+# Localizar placas primero y reconocer solo esas regiones (False: detector CRAFT de EasyOCR)
+PLATE_LOCALIZER = True
+ALLOW_LIST = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ-'
+
+
+def create_reader(gpu=True):
+    """Crea el lector de EasyOCR; devuelve (reader, usa_gpu)."""
+    import easyocr
+    if gpu:
+        try:
+            return easyocr.Reader(['es', 'en'], gpu=True, verbose=False, quantize=True), True
+        except Exception as e:
+            print(f"GPU no disponible: {e}")
+    return easyocr.Reader(['es', 'en'], gpu=False, verbose=False), False
+
+
+class PlateOcr:
+    """Preprocesado, propuesta de regiones, reconocimiento y filtrado de placas.
+
+    No depende de la interfaz: lo usan el hilo de OCR de la app y los
+    procesos del pool (pool_ocr.py).
+    """
+
+    def __init__(self, reader=None, allow_list=ALLOW_LIST,
+                 max_batch=OCR_MAX_BATCH, max_latency=OCR_MAX_LATENCY):
+        self.allow_list = allow_list
+        self.localizer = PlateLocalizer()
+        self.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+        self.sharpen_kernel = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]])
+        # Reconocimiento por lotes entre cuadros (ver lote_ocr.py)
+        self.batcher = OcrBatcher(reader, allow_list, max_batch, max_latency)
+        self.detect_calls = 0
+
+    @property
+    def calls(self):
+        """Llamadas a EasyOCR (detección + reconocimiento) hechas hasta ahora."""
+        return self.detect_calls + self.batcher.batches
+
+    @property
+    def reader(self):
+        return self.batcher.reader
+
+    @reader.setter
+    def reader(self, reader):
+        self.batcher.reader = reader
+
+    def preprocess(self, frame):
+        """Reduce, pasa a gris, ecualiza (CLAHE) y enfoca el cuadro."""
+        h, w = frame.shape[:2]
+        small_w = int(w * PROCESS_SCALE_FACTOR)
+        small_h = int(h * PROCESS_SCALE_FACTOR)
+        small_frame = cv2.resize(frame, (small_w, small_h),
+                                interpolation=cv2.INTER_LINEAR)
+
+        gray = cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY)
+        enhanced = self.clahe.apply(gray)
+        return cv2.filter2D(enhanced, -1, self.sharpen_kernel)
+
+    def propose_regions(self, sharpened):
+        """Cajas (N, 4) x1, y1, x2, y2 con posible texto de placa."""
+        if PLATE_LOCALIZER:
+            return self.localizer.propose(sharpened)
+
+        self.detect_calls += 1
+        horizontal, free = self.reader.detect(
+            sharpened,
+            text_threshold=0.6,
+            low_text=0.3,
+            link_threshold=0.3
+        )
+        boxes = [[x1, y1, x2, y2] for x1, x2, y1, y2 in horizontal[0]]
+        for quad in free[0]:
+            pts = np.asarray(quad)
+            boxes.append([*pts.min(axis=0), *pts.max(axis=0)])
+        return np.array(boxes, dtype=np.int32).reshape(-1, 4)
+
+    def to_detections(self, results):
+        """Filtra los textos que parecen placa y los lleva a la escala del cuadro original."""
+        scale_inv = 1.0 / PROCESS_SCALE_FACTOR
+        detections = []
+
+        for bbox, text, prob in results:
+            if prob >= MIN_CONFIDENCE:
+                text_clean = "".join(text.split()).upper()
+
+                if (len(text_clean) >= MIN_PLATE_CHARS and
+                    any(c.isdigit() for c in text_clean)):
+
+                    scaled_bbox = [[int(p[0]*scale_inv), int(p[1]*scale_inv)]
+                                  for p in bbox]
+                    detections.append((scaled_bbox, text_clean, prob))
+        return detections
+
+    def add(self, sharpened, timestamp):
+        """Encola las regiones de un cuadro preprocesado en el lote."""
+        self.batcher.add(timestamp, sharpened, self.propose_regions(sharpened))
+
+    def pending_timestamps(self):
+        """Marcas de tiempo de los cuadros que esperan en el lote."""
+        return [timestamp for timestamp, _, _ in self.batcher.pending]
+
+    def due(self):
+        return self.batcher.due()
+
+    def wait_time(self):
+        return self.batcher.wait_time()
+
+    def flush(self):
+        """Reconoce el lote; devuelve [(timestamp, detecciones), ...] en orden de llegada."""
+        return [(timestamp, self.to_detections(results)) for timestamp, results in self.batcher.flush()]
+
+    def process(self, sharpened, timestamp):
+        """Reconoce un solo cuadro sin esperar a completar un lote."""
+        self.add(sharpened, timestamp)
+        flushed = self.flush()
+        return flushed[0][1] if flushed else []
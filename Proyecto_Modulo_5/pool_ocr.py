@@ -0,0 +1,167 @@
+import heapq
+import multiprocessing as mp
+import os
+import queue
+import time
+
+# Cuadros en espera por proceso antes de descartar nuevos
+TASKS_PER_WORKER = 2
+# Un resultado que no llega en este tiempo (proceso caído) deja de bloquear el orden
+RESULT_TIMEOUT = 10.0
+
+
+def _worker_main(task_q, result_q, gpu, threads):
+    """Proceso de OCR: su propio lector de EasyOCR y su propio PlateOcr, con lotes entre cuadros."""
+    import torch
+    torch.set_num_threads(threads)
+
+    from ocr_placas import PlateOcr, create_reader
+    try:
+        reader, used_gpu = create_reader(gpu)
+    except Exception as e:
+        result_q.put(("error", os.getpid(), str(e)))
+        return
+    ocr = PlateOcr(reader)
+    result_q.put(("ready", os.getpid(), used_gpu))
+
+    # Igual que el hilo de OCR de la app: los cuadros se juntan en lotes
+    # (OcrBatcher) y se reconocen juntos al llenarse o vencer el lote
+    waiting = {}  # timestamp -> (seq, inicio)
+    while True:
+        wait = ocr.wait_time()
+        try:
+            task = task_q.get(timeout=wait)
+        except queue.Empty:
+            task = False
+        if task is None:
+            break
+        if task:
+            seq, timestamp, sharpened = task
+            waiting[timestamp] = (seq, time.perf_counter())
+            try:
+                ocr.add(sharpened, timestamp)
+            except Exception as e:
+                print(f"Error OCR (proceso {os.getpid()}): {e}")
+                waiting.pop(timestamp)
+                result_q.put(("result", seq, (timestamp, [], 0.0, 0)))
+
+        if not ocr.due():
+            continue
+        batch = ocr.pending_timestamps()
+        calls = ocr.calls
+        try:
+            flushed = ocr.flush()
+        except Exception as e:
+            print(f"Error OCR (proceso {os.getpid()}): {e}")
+            flushed = [(timestamp, []) for timestamp in batch]
+        # Las llamadas del lote se cuentan una sola vez, en su primer cuadro
+        calls = ocr.calls - calls
+        now = time.perf_counter()
+        for timestamp, detections in flushed:
+            seq, t0 = waiting.pop(timestamp)
+            result_q.put(("result", seq, (timestamp, detections, now - t0, calls)))
+            calls = 0
+
+
+class OcrWorkerPool:
+    """Reparte cuadros preprocesados entre procesos de OCR y devuelve los resultados en orden.
+
+    Cada proceso carga su propio lector. Cada cuadro recibe un número de
+    secuencia al despacharse; los resultados que llegan adelantados esperan
+    en un heap hasta que llegan los anteriores, así el tracker siempre ve los
+    cuadros en orden de captura.
+    """
+
+    def __init__(self, workers, gpu=False):
+        self.workers = workers
+        ctx = mp.get_context("spawn")
+        self.task_q = ctx.Queue(maxsize=workers * TASKS_PER_WORKER)
+        self.result_q = ctx.Queue()
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        self.processes = [ctx.Process(target=_worker_main, args=(self.task_q, self.result_q, gpu, threads),
+                                      daemon=True)
+                          for _ in range(workers)]
+        for p in self.processes:
+            p.start()
+
+        self.ready = 0
+        self.errors = []
+        self.next_seq = 0
+        self.next_out = 0
+        self.pending = []
+        self.sent_at = {}
+        self.dispatched = 0
+        self.dropped = 0
+        self.lost = 0
+
+    @property
+    def in_flight(self):
+        return self.next_seq - self.next_out
+
+    def has_capacity(self):
+        return self.ready > 0 and not self.task_q.full()
+
+    def submit(self, sharpened, timestamp):
+        """Despacha un cuadro; devuelve False si todos los procesos están ocupados."""
+        try:
+            self.task_q.put_nowait((self.next_seq, timestamp, sharpened))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.sent_at[self.next_seq] = (time.perf_counter(), timestamp)
+        self.next_seq += 1
+        self.dispatched += 1
+        return True
+
+    def results(self, timeout=0.1):
+        """Recoge resultados; devuelve [(timestamp, detecciones, segundos, llamadas OCR), ...] en orden de despacho.
+
+        Un cuadro que se da por perdido tras RESULT_TIMEOUT se devuelve con
+        detecciones None, para que quien lo despachó pueda liberarlo.
+        """
+        try:
+            msg = self.result_q.get(timeout=timeout)
+            while True:
+                self._handle(msg)
+                msg = self.result_q.get_nowait()
+        except queue.Empty:
+            pass
+
+        ordered = []
+        now = time.perf_counter()
+        while self.pending and self.pending[0][0] < self.next_out:
+            heapq.heappop(self.pending)  # llegó después de darlo por perdido
+        while self.next_out < self.next_seq:
+            if self.pending and self.pending[0][0] == self.next_out:
+                ordered.append(heapq.heappop(self.pending)[1])
+            else:
+                sent, timestamp = self.sent_at[self.next_out]
+                if now - sent < RESULT_TIMEOUT:
+                    break
+                self.lost += 1
+                ordered.append((timestamp, None, now - sent, 0))
+            del self.sent_at[self.next_out]
+            self.next_out += 1
+        return ordered
+
+    def _handle(self, msg):
+        kind, key, value = msg
+        if kind == "result":
+            heapq.heappush(self.pending, (key, value))
+        elif kind == "ready":
+            self.ready += 1
+            print(f"Proceso OCR {key} listo ({'GPU' if value else 'CPU'})")
+        elif kind == "error":
+            self.errors.append(value)
+            print(f"Error en proceso OCR {key}: {value}")
+
+    def close(self, timeout=2.0):
+        for _ in self.processes:
+            try:
+                self.task_q.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        for p in self.processes:
+            p.join(timeout=timeout)
+            if p.is_alive():
+                p.terminate()
@@ -0,0 +1,186 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+import cv2
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "data", "placas.db")
+THUMBS_DIR = os.path.join(BASE_DIR, "data", "miniaturas")
+
+# El escritor agrupa hasta WRITE_BATCH avistamientos o espera como máximo WRITE_INTERVAL s
+WRITE_BATCH = 50
+WRITE_INTERVAL = 1.0
+# Avistamientos en espera; si el disco no da abasto se descartan en lugar de frenar la captura
+MAX_PENDING = 1000
+THUMB_HEIGHT = 64
+# Placas seguidas cuyo avistamiento todavía puede corregirse (id del tracker -> fila)
+MAX_TRACKED_ROWS = 1000
+# Caracteres especiales de GLOB que se buscan literalmente
+GLOB_ESCAPES = {"*": "[*]", "?": "[?]", "[": "[[]"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sightings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    timestamp REAL NOT NULL,
+    thumbnail TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sightings_text ON sightings (text);
+CREATE INDEX IF NOT EXISTS idx_sightings_time ON sightings (timestamp);
+"""
+
+
+class SightingStore:
+    """Guarda avistamientos de placas en SQLite desde un hilo escritor por lotes.
+
+    record() solo encola (nunca bloquea); el hilo escritor guarda la
+    miniatura en disco e inserta los avistamientos en una transacción por
+    lote. Con 'track_id', update() corrige después el texto de ese
+    avistamiento cuando el tracker obtiene una lectura más confiable.
+    """
+
+    def __init__(self, path=DB_PATH, thumbs_dir=THUMBS_DIR,
+                 batch_size=WRITE_BATCH, interval=WRITE_INTERVAL):
+        self.path = path
+        self.thumbs_dir = thumbs_dir
+        self.batch_size = batch_size
+        self.interval = interval
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.makedirs(thumbs_dir, exist_ok=True)
+
+        with closing(sqlite3.connect(path)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self.queue = queue.Queue(maxsize=MAX_PENDING)
+        self.written = 0
+        self.dropped = 0
+        self.running = True
+        self.thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.thread.start()
+
+    def record(self, text, confidence, timestamp, crop=None, track_id=None):
+        """Encola un avistamiento; 'crop' es el recorte BGR de la placa (opcional)."""
+        if crop is not None and crop.size:
+            scale = THUMB_HEIGHT / crop.shape[0]
+            crop = cv2.resize(crop, (max(1, int(crop.shape[1] * scale)), THUMB_HEIGHT),
+                              interpolation=cv2.INTER_AREA)
+        else:
+            crop = None
+        self._put(("insert", text, float(confidence), float(timestamp), crop, track_id))
+
+    def update(self, track_id, text, confidence):
+        """Encola la corrección del texto del avistamiento registrado para 'track_id'."""
+        self._put(("update", text, float(confidence), track_id))
+
+    def _put(self, item):
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def _thumbnail(self, text, timestamp, crop):
+        if crop is None:
+            return None
+        name = f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(timestamp))}_{int(timestamp * 1000) % 1000:03d}_{text}.jpg"
+        path = os.path.join(self.thumbs_dir, name)
+        ok, buf = cv2.imencode(".jpg", crop)
+        if not ok:
+            return None
+        buf.tofile(path)
+        return path
+
+    def _thumbnail_safe(self, text, ts, crop):
+        # Un error de disco en la miniatura no debe tumbar el hilo escritor
+        try:
+            return self._thumbnail(text, ts, crop)
+        except Exception as e:
+            print(f"Error guardando miniatura de {text}: {e}")
+            return None
+
+    def _write(self, conn, batch, track_rows):
+        """Inserta y corrige un lote en una transacción; devuelve los avistamientos nuevos."""
+        # Las miniaturas se escriben antes de abrir la transacción
+        thumbnails = [self._thumbnail_safe(item[1], item[3], item[4]) if item[0] == "insert" else None
+                      for item in batch]
+        inserted = 0
+        with conn:
+            for item, thumbnail in zip(batch, thumbnails):
+                if item[0] == "insert":
+                    _, text, conf, ts, _, track_id = item
+                    cur = conn.execute(
+                        "INSERT INTO sightings (text, confidence, timestamp, thumbnail) "
+                        "VALUES (?, ?, ?, ?)", (text, conf, ts, thumbnail))
+                    inserted += 1
+                    if track_id is not None:
+                        track_rows[track_id] = cur.lastrowid
+                        if len(track_rows) > MAX_TRACKED_ROWS:
+                            del track_rows[next(iter(track_rows))]
+                else:
+                    _, text, conf, track_id = item
+                    row = track_rows.get(track_id)
+                    if row is not None:
+                        conn.execute("UPDATE sightings SET text = ?, confidence = ? WHERE id = ?",
+                                     (text, conf, row))
+        return inserted
+
+    def _writer_loop(self):
+        conn = sqlite3.connect(self.path)
+        track_rows = {}
+        batch = []
+        deadline = None
+        while self.running or not self.queue.empty() or batch:
+            try:
+                timeout = 0.1 if deadline is None else max(0.0, deadline - time.perf_counter())
+                batch.append(self.queue.get(timeout=timeout))
+                if deadline is None:
+                    deadline = time.perf_counter() + self.interval
+            except queue.Empty:
+                pass
+
+            if batch and (len(batch) >= self.batch_size or time.perf_counter() >= deadline
+                          or not self.running):
+                try:
+                    self.written += self._write(conn, batch, track_rows)
+                except sqlite3.Error as e:
+                    print(f"Error guardando avistamientos: {e}")
+                batch = []
+                deadline = None
+        conn.close()
+
+    def search(self, text=None, start=None, end=None, limit=100):
+        """Consulta avistamientos por texto (prefijo con '%') y rango de tiempo, más recientes primero."""
+        clauses, params = [], []
+        if text:
+            text = text.upper()
+            if "%" in text or "_" in text:
+                # GLOB distingue mayúsculas como el índice (BINARY) y lo usa para
+                # el prefijo; LIKE no sensible a mayúsculas recorrería toda la tabla.
+                # '*', '?' y '[' del usuario se buscan literalmente.
+                pattern = "".join(GLOB_ESCAPES.get(c, c) for c in text)
+                clauses.append("text GLOB ?")
+                params.append(pattern.replace("%", "*").replace("_", "?"))
+            else:
+                clauses.append("text = ?")
+                params.append(text)
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with closing(sqlite3.connect(self.path)) as conn:
+            return conn.execute(
+                f"SELECT text, confidence, timestamp, thumbnail FROM sightings {where} "
+                "ORDER BY timestamp DESC LIMIT ?", params + [limit]).fetchall()
+
+    def close(self, timeout=5.0):
+        """Escribe lo pendiente y detiene el hilo escritor."""
+        self.running = False
+        self.thread.join(timeout=timeout)
@@ -0,0 +1,104 @@
+import argparse
+import json
+import queue
+import time
+
+import numpy as np
+
+from app import LicensePlateRecognizer
+from fuentes import SPEEDS
+
+
+def percentiles(values):
+    v = np.asarray(values, dtype=np.float64)
+    if not len(v):
+        return {"n": 0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    return {
+        "n": int(len(v)),
+        "p50_ms": float(np.percentile(v, 50)),
+        "p95_ms": float(np.percentile(v, 95)),
+        "p99_ms": float(np.percentile(v, 99)),
+        "max_ms": float(v.max()),
+    }
+
+
+def run(source, speed, max_seconds=None):
+    """Corre el reconocedor sin interfaz hasta agotar la fuente; devuelve el reporte."""
+    app_queue = queue.Queue()
+    recognizer = LicensePlateRecognizer(app_queue, source, speed, headless=True)
+    try:
+        wall = _measure(recognizer, app_queue, source, max_seconds)
+    finally:
+        # Siempre se detiene: cierra el registro (hilo escritor), el pool y la fuente
+        recognizer.stop()
+
+    stats = recognizer.stats
+    return {
+        "fuente": str(source),
+        "velocidad": speed,
+        "tiempo_s": round(wall, 3),
+        "cuadros": stats["frames"],
+        "cuadros_por_s": stats["frames"] / wall if wall > 0 else 0.0,
+        "cuadros_saltados": getattr(recognizer.cap, "skipped", 0),
+        "cuadros_ocr": stats["ocr_frames"],
+        "llamadas_ocr": stats["ocr_calls"],
+        "placas": stats["plates"],
+        "placas_por_s": stats["plates"] / wall if wall > 0 else 0.0,
+        "avistamientos_guardados": recognizer.store.written,
+        "latencia_ocr": percentiles(recognizer.latencies_ms),
+    }
+
+
+def _measure(recognizer, app_queue, source, max_seconds):
+    """Espera a que la fuente se agote (o a max_seconds); devuelve los segundos medidos."""
+    recognizer.start()
+    if not recognizer.running:
+        raise IOError(f"no se pudo abrir la fuente '{source}'")
+
+    t0 = None
+    while True:
+        # Solo llegan mensajes de estado y errores (sin cuadros de video)
+        try:
+            msg = app_queue.get(timeout=0.05)
+            if msg[0] == "status" and (msg[1].startswith("ALERTA") or "listo" in msg[1]):
+                print(msg[1])
+            elif msg[0] == "error":
+                raise RuntimeError(msg[1])
+        except queue.Empty:
+            pass
+        # Cuadros, saltos y tiempo se miden desde el mismo instante: el primer cuadro con OCR listo
+        t0 = recognizer.started_at
+        if recognizer.idle:
+            break
+        if max_seconds and t0 is not None and time.perf_counter() - t0 > max_seconds:
+            break
+    return time.perf_counter() - t0 if t0 is not None else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rendimiento del reconocedor de placas sin interfaz.")
+    parser.add_argument("fuente", help="Archivo de video, carpeta de imágenes o índice de cámara")
+    parser.add_argument("--velocidad", default="rapido", choices=SPEEDS)
+    parser.add_argument("--max-segundos", type=float, help="Cortar la prueba tras este tiempo")
+    parser.add_argument("--json", help="Guardar el reporte en este archivo")
+    args = parser.parse_args()
+
+    report = run(args.fuente, args.velocidad, args.max_segundos)
+    lat = report["latencia_ocr"]
+    print("=" * 50)
+    print(f" {report['cuadros']} cuadros en {report['tiempo_s']:.1f} s "
+          f"({report['cuadros_por_s']:.1f} cuadros/s, {report['cuadros_saltados']} saltados)")
+    print(f" OCR: {report['cuadros_ocr']} cuadros, {report['llamadas_ocr']} llamadas")
+    print(f" Placas confirmadas: {report['placas']} ({report['placas_por_s']:.2f}/s)")
+    print(f" Latencia OCR ms: p50 {lat['p50_ms']:.0f} · p95 {lat['p95_ms']:.0f} · "
+          f"p99 {lat['p99_ms']:.0f} · máx {lat['max_ms']:.0f}")
+    print("=" * 50)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Reporte guardado en '{args.json}'")
+
+
+if __name__ == "__main__":
+    main()
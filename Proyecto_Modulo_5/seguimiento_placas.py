@@ -0,0 +1,138 @@
+import threading
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+MAX_TRACKING_AGE = 1.0
+IOU_THRESHOLD = 0.25
+# Detecciones necesarias para considerar confirmada una placa
+MIN_DETECTIONS = 2
+
+
+def polygons_to_boxes(polygons):
+    """Polígonos de EasyOCR (M, P, 2) a cajas (M, 4) como x1, y1, x2, y2."""
+    if not len(polygons):
+        return np.empty((0, 4), dtype=np.float32)
+    pts = np.asarray(polygons, dtype=np.float32).reshape(len(polygons), -1, 2)
+    return np.concatenate([pts.min(axis=1), pts.max(axis=1)], axis=1)
+
+
+def iou_matrix(a, b):
+    """IoU entre todas las cajas de a (M, 4) y b (N, 4)."""
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
+class PlateTracker:
+    """Maneja el seguimiento de placas detectadas.
+
+    El estado de las placas vive en arreglos paralelos (una fila por placa):
+    la IoU detección-placa se calcula en una sola matriz, la asignación es
+    óptima (algoritmo húngaro) con un umbral de IoU y el envejecimiento se
+    hace con máscaras.
+    """
+
+    def __init__(self, max_age=MAX_TRACKING_AGE, iou_threshold=IOU_THRESHOLD):
+        self.max_age = max_age
+        self.iou_threshold = iou_threshold
+        self.lock = threading.Lock()
+        self.next_id = 0
+
+        self.ids = np.empty(0, dtype=np.int64)
+        self.boxes = np.empty((0, 4), dtype=np.float32)
+        self.confidence = np.empty(0, dtype=np.float32)
+        self.best_conf = np.empty(0, dtype=np.float32)
+        self.last_seen = np.empty(0, dtype=np.float64)
+        self.detections = np.empty(0, dtype=np.int32)
+        self.polygons = []
+        self.texts = []
+        # Placas que alcanzaron MIN_DETECTIONS en la última actualización: [(id, bbox, texto, confianza)]
+        self.last_confirmed = []
+        # Placas ya confirmadas cuyo texto cambió (lectura más confiable) en la última actualización
+        self.last_improved = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _keep(self, mask):
+        self.ids = self.ids[mask]
+        self.boxes = self.boxes[mask]
+        self.confidence = self.confidence[mask]
+        self.best_conf = self.best_conf[mask]
+        self.last_seen = self.last_seen[mask]
+        self.detections = self.detections[mask]
+        idx = np.flatnonzero(mask)
+        self.polygons = [self.polygons[i] for i in idx]
+        self.texts = [self.texts[i] for i in idx]
+
+    def _append(self, polygons, boxes, texts, confs, current_time):
+        n = len(texts)
+        self.ids = np.concatenate([self.ids, np.arange(self.next_id, self.next_id + n)])
+        self.next_id += n
+        self.boxes = np.concatenate([self.boxes, boxes])
+        self.confidence = np.concatenate([self.confidence, confs])
+        self.best_conf = np.concatenate([self.best_conf, confs])
+        self.last_seen = np.concatenate([self.last_seen, np.full(n, current_time)])
+        self.detections = np.concatenate([self.detections, np.ones(n, dtype=np.int32)])
+        self.polygons += polygons
+        self.texts += texts
+
+    def _rows(self, mask):
+        return [(self.polygons[i], self.texts[i], float(self.confidence[i])) for i in np.flatnonzero(mask)]
+
+    def update(self, detections, current_time):
+        """Actualiza tracking con nuevas detecciones [(bbox, texto, confianza), ...]."""
+        polygons = [d[0] for d in detections]
+        texts = [d[1] for d in detections]
+        confs = np.array([d[2] for d in detections], dtype=np.float32)
+        boxes = polygons_to_boxes(polygons)
+
+        with self.lock:
+            self._keep(current_time - self.last_seen <= self.max_age)
+
+            matched = np.zeros(len(detections), dtype=bool)
+            improved = []
+            if len(self) and len(detections):
+                iou = iou_matrix(boxes, self.boxes)
+                det, trk = linear_sum_assignment(iou, maximize=True)
+                gate = iou[det, trk] > self.iou_threshold
+                det, trk = det[gate], trk[gate]
+                matched[det] = True
+
+                c = confs[det]
+                better = c > self.best_conf[trk]
+                self.confidence[trk] = self.confidence[trk] * 0.6 + c * 0.4
+                self.best_conf[trk] = np.maximum(self.best_conf[trk], c)
+                self.boxes[trk] = boxes[det]
+                self.last_seen[trk] = current_time
+                self.detections[trk] += 1
+                for d, t, b in zip(det, trk, better):
+                    self.polygons[t] = polygons[d]
+                    if b:
+                        if self.texts[t] != texts[d] and self.detections[t] > MIN_DETECTIONS:
+                            improved.append(t)
+                        self.texts[t] = texts[d]
+            self.last_improved = [(int(self.ids[t]), self.polygons[t], self.texts[t],
+                                   float(self.confidence[t])) for t in improved]
+
+            new = np.flatnonzero(~matched)
+            if len(new):
+                self._append([polygons[i] for i in new], boxes[new], [texts[i] for i in new],
+                             confs[new], current_time)
+
+            confirmed = (self.detections == MIN_DETECTIONS) & (self.last_seen == current_time)
+            self.last_confirmed = [(int(self.ids[i]),) + row
+                                   for i, row in zip(np.flatnonzero(confirmed), self._rows(confirmed))]
+            return self._rows(self.detections >= MIN_DETECTIONS)
+
+    def get_all_active(self, current_time):
+        """Obtiene todas las placas activas."""
+        with self.lock:
+            return self._rows(current_time - self.last_seen < self.max_age)
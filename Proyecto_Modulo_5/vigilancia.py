@@ -0,0 +1,110 @@
+import os
+import re
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+WATCHLIST_PATH = os.path.join(BASE_DIR, "data", "lista_vigilancia.txt")
+# Caracteres distintos tolerados (errores típicos del OCR: 0/O, 1/I, 8/B)
+MAX_EDIT_DISTANCE = 1
+
+
+def normalize_plate(text):
+    """Solo letras y dígitos en mayúscula: 'abc-1234' y 'ABC 1234' son la misma placa."""
+    return re.sub(r"[^0-9A-Z]", "", text.upper())
+
+
+def edit_distance(a, b):
+    """Distancia de Levenshtein."""
+    if len(a) < len(b):
+        a, b = b, a
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+class BKTree:
+    """Árbol BK: búsqueda por distancia de edición sin comparar con todas las placas."""
+
+    def __init__(self, words=()):
+        self.root = None
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        if self.root is None:
+            self.root = (word, {})
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            d = edit_distance(word, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = (word, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """Devuelve [(distancia, palabra), ...] ordenado por distancia."""
+        if self.root is None:
+            return []
+        found, stack = [], [self.root]
+        while stack:
+            value, children = stack.pop()
+            d = edit_distance(word, value)
+            if d <= max_distance:
+                found.append((d, value))
+            # Desigualdad triangular: solo hijos con |d - k| <= max_distance pueden coincidir
+            for k, child in children.items():
+                if d - max_distance <= k <= d + max_distance:
+                    stack.append(child)
+        return sorted(found)
+
+
+class Watchlist:
+    """Placas buscadas: coincidencia exacta con un set y aproximada con el árbol BK."""
+
+    def __init__(self, plates=(), max_distance=MAX_EDIT_DISTANCE):
+        self.max_distance = max_distance
+        self.plates = {}
+        self.tree = BKTree()
+        for plate in plates:
+            self.add(plate)
+
+    def __len__(self):
+        return len(self.plates)
+
+    def add(self, plate):
+        key = normalize_plate(plate)
+        if key and key not in self.plates:
+            self.plates[key] = plate.strip()
+            self.tree.add(key)
+
+    def match(self, text):
+        """Devuelve (placa de la lista, distancia) o None."""
+        key = normalize_plate(text)
+        if key in self.plates:
+            return self.plates[key], 0
+        if self.max_distance <= 0:
+            return None
+        found = self.tree.search(key, self.max_distance)
+        if not found:
+            return None
+        d, best = found[0]
+        return self.plates[best], d
+
+    @classmethod
+    def load(cls, path=WATCHLIST_PATH, max_distance=MAX_EDIT_DISTANCE):
+        """Una placa por línea; se ignoran líneas vacías y las que empiezan con '#'."""
+        if not os.path.exists(path):
+            return cls(max_distance=max_distance)
+        with open(path, encoding="utf-8") as f:
+            plates = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        return cls(plates, max_distance)